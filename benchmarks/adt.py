@@ -0,0 +1,51 @@
+"""Option, Either and Try benchmarks
+
+poetry run python benchmarks/adt.py
+"""
+from timeit import timeit
+from typing import Any, Callable
+
+from pycategory import VOID, Failure, Left, Right, Some, Success, Void
+
+NUMBER = 200_000
+
+
+def increment(value: int, /) -> int:
+    return value + 1
+
+
+def fold(instance: Any, /) -> Callable[[], Any]:
+    match instance:
+        case Some() | Void():
+            return lambda: instance.fold(void=lambda: 0, some=increment)
+        case Left() | Right():
+            return lambda: instance.fold(left=lambda _: 0, right=increment)
+        case _:
+            return lambda: instance.fold(failure=lambda _: 0, success=increment)
+
+
+def main() -> None:
+    cases = (
+        ("Some", Some(1), Some),
+        ("Void", VOID, Some),
+        ("Right", Right(1), Right),
+        ("Left", Left(1), Right),
+        ("Success", Success(1), Success),
+        ("Failure", Failure(Exception()), Success),
+    )
+    for name, instance, pure in cases:
+        timings = {
+            "map": timeit(lambda: instance.map(increment), number=NUMBER),
+            "flat_map": timeit(
+                lambda: instance.flat_map(lambda value: pure(value + 1)), number=NUMBER
+            ),
+            "fold": timeit(fold(instance), number=NUMBER),
+        }
+        print(f"{name:<8}", " ".join(f"{key} {value:.3f}s" for key, value in timings.items()))
+    direct = timeit(lambda: Some(1), number=NUMBER)
+    aliased = timeit(lambda: Some[int](1), number=NUMBER)
+    print(f"construction Some(1) {direct:.3f}s Some[int](1) {aliased:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
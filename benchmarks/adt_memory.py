@@ -0,0 +1,48 @@
+"""Option, Either and Try memory benchmarks
+
+poetry run python benchmarks/adt_memory.py
+"""
+import tracemalloc
+from typing import Any, Callable
+
+from pycategory import Failure, Left, Right, Some, Success
+
+NUMBER = 100_000
+
+
+class DictSome:
+    """Some with __dict__ as the baseline"""
+
+    def __init__(self, value: Any, /):
+        self.value = value
+
+
+def footprint(build: Callable[[Any], Any], arguments: list[Any], /) -> float:
+    """Bytes allocated per instance, including its slot in the list holding it."""
+    tracemalloc.start()
+    instances = [build(argument) for argument in arguments]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return size / NUMBER
+
+
+def main() -> None:
+    values = list(range(NUMBER))
+    exceptions = [Exception() for _ in range(NUMBER)]
+    cases: tuple[tuple[str, Callable[[Any], Any], list[Any]], ...] = (
+        ("DictSome", DictSome, values),
+        ("Some", Some, values),
+        ("Left", Left, values),
+        ("Right", Right, values),
+        ("Success", Success, values),
+        ("Failure", Failure, exceptions),
+        ("Some(None)", lambda _: Some(None), values),
+        ("Right(True)", lambda _: Right(True), values),
+    )
+    for name, build, arguments in cases:
+        print(f"{name:<12} {footprint(build, arguments):.1f} bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
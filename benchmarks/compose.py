@@ -0,0 +1,38 @@
+"""Function1.compose and and_then benchmarks
+
+poetry run python benchmarks/compose.py
+"""
+from functools import reduce
+from timeit import timeit
+from typing import Any, Callable
+
+from pycategory.function_ import Function1
+
+NUMBER = 20_000
+STAGES = 50
+
+
+class NestedFunction1(Function1[Any, Any]):
+    """Previous implementation: a lambda and a Function1 per composition."""
+
+    def and_then(self, other: Callable[[Any], Any]) -> Function1[Any, Any]:
+        return NestedFunction1(lambda arg: other(self(arg)))
+
+
+def increment(value: int, /) -> int:
+    return value + 1
+
+
+def main() -> None:
+    for name, type_ in (("nested", NestedFunction1), ("flat", Function1)):
+        composed = reduce(
+            lambda composed, _: composed.and_then(type_(increment)),
+            range(STAGES - 1),
+            type_(increment),
+        )
+        seconds = timeit(lambda: composed(0), number=NUMBER)
+        print(f"{name:<7} {STAGES} stages call {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""curry benchmarks
+
+poetry run python benchmarks/curry.py
+"""
+import inspect
+from copy import deepcopy
+from timeit import timeit
+from typing import Any, Callable
+
+from pycategory import curry
+from pycategory.function_ import Function1, partial_application_scope
+from pycategory.processor import apply_defaults
+
+NUMBER = 20_000
+
+
+def deepcopy_curry(func: Callable[..., Any], /) -> Any:
+    """Previous implementation: deepcopy of the arguments at each partial application."""
+
+    def closure(*, arguments: dict[str, Any], position: int) -> Any:
+        def partial_application(value: Any, /) -> Any:
+            applied = deepcopy(arguments)
+            applied[list(arguments)[position]] = value
+            if position < partial_application_scope(arguments=applied, function=func) - 1:
+                return closure(arguments=applied, position=position + 1)
+            defaults_applied = apply_defaults(arguments=applied, function=func)
+            scope = partial_application_scope(arguments=defaults_applied, function=func)
+            return func(*tuple(applied.values())[:scope])
+
+        return Function1(partial_application)
+
+    return closure(arguments=deepcopy(inspect.signature(func).parameters.copy()), position=0)
+
+
+def add5(arg1: int, arg2: int, arg3: int, arg4: int, arg5: int) -> int:
+    return arg1 + arg2 + arg3 + arg4 + arg5
+
+
+def main() -> None:
+    payload = [list(range(100)) for _ in range(10)]
+
+    def payload5(arg1: Any, arg2: Any, arg3: Any, arg4: Any, arg5: Any) -> int:
+        return len(arg1)
+
+    for name, implementation in (("deepcopy", deepcopy_curry), ("curry", curry)):
+        curried = implementation(add5)
+        curried_payload = implementation(payload5)
+        timings = {
+            "decorate": timeit(lambda: implementation(add5), number=NUMBER),
+            "apply": timeit(lambda: curried(1)(2)(3)(4)(5), number=NUMBER),
+            "apply payload": timeit(
+                lambda: curried_payload(payload)(payload)(payload)(payload)(payload),
+                number=NUMBER // 10,
+            ),
+        }
+        print(f"{name:<9}", " ".join(f"{key} {value:.3f}s" for key, value in timings.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Frame benchmarks
+
+poetry run python benchmarks/frame.py
+"""
+import tracemalloc
+from timeit import timeit
+
+from pycategory import Frame, processor
+
+NUMBER = 10_000
+
+
+class Error(Frame):
+    ...
+
+
+def fail(value: int, /) -> Error:
+    payload = [value] * 100  # noqa: F841 # Masked Frame variable
+    return Error(unmask=("value",))
+
+
+def main() -> None:
+    for capture in processor.Capture:
+        Error.CAPTURE = capture
+        seconds = timeit(lambda: fail(42), number=NUMBER)
+        tracemalloc.start()
+        errors = [fail(value) for value in range(NUMBER)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del errors
+        print(f"{capture.name:<9} {seconds:.3f}s {size / NUMBER:.1f} bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
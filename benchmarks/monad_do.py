@@ -0,0 +1,71 @@
+"""Monad.do benchmarks
+
+poetry run python benchmarks/monad_do.py
+"""
+from timeit import timeit
+
+from pycategory import (
+    Either,
+    EitherDo,
+    Left,
+    Option,
+    OptionDo,
+    Right,
+    Some,
+    Success,
+    Try,
+    TryDo,
+)
+
+NUMBER = 50_000
+
+
+def either_context(value: int, /) -> EitherDo[str, int]:
+    one = yield from Right(value)
+    two = yield from Right(one + 1)
+    three = yield from Right(two + 1)
+    return one + two + three
+
+
+def either_failure_context(value: int, /) -> EitherDo[str, int]:
+    one = yield from Right(value)
+    _ = yield from Left("error")
+    return one
+
+
+def option_context(value: int, /) -> OptionDo[int]:
+    one = yield from Some(value)
+    two = yield from Some(one + 1)
+    three = yield from Some(two + 1)
+    return one + two + three
+
+
+def try_context(value: int, /) -> TryDo[int]:
+    one = yield from Success(value)
+    two = yield from Success(one + 1)
+    three = yield from Success(two + 1)
+    return one + two + three
+
+
+def main() -> None:
+    cases = (
+        ("Either.do", Either.do, either_context),
+        ("Either.do failure", Either.do, either_failure_context),
+        ("Option.do", Option.do, option_context),
+        ("Try.do", Try.do, try_context),
+    )
+    for name, do, context in cases:
+        generator = do(context)
+        compiled = do(compile=True)(context)
+        assert generator(1) == compiled(1)
+        generator_time = timeit(lambda: generator(1), number=NUMBER)
+        compiled_time = timeit(lambda: compiled(1), number=NUMBER)
+        print(
+            f"{name:<20} generator {generator_time:.3f}s"
+            f" compiled {compiled_time:.3f}s"
+            f" x{generator_time / compiled_time:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Monad.do benchmarks for contexts that mostly short circuit
+
+poetry run python benchmarks/monad_do_failure.py
+"""
+from collections.abc import Generator
+from timeit import repeat
+from typing import Any, Callable, TypeVar
+
+from pycategory import Either, EitherDo, Failure, Left, Right, Try
+
+L = TypeVar("L")
+R = TypeVar("R")
+T = TypeVar("T")
+
+NUMBER = 100_000
+REPEAT = 5
+
+
+class RaisingLeft(Left[L, R]):
+    """Previous protocol: short circuit by raising GeneratorExit."""
+
+    def __iter__(self) -> Generator[Either[L, R], None, R]:
+        raise GeneratorExit(self)
+
+
+class RaisingFailure(Failure[T]):
+    """Previous protocol: short circuit by raising GeneratorExit."""
+
+    def __iter__(self) -> Generator[Try[T], None, T]:
+        raise GeneratorExit(self) from self.exception
+
+
+def short_circuit(
+    invalid: Either[str, int] | Try[int], /
+) -> Callable[[], Generator[Any, Any, int]]:
+    """Context whose first yield short circuits, so only the protocol is timed."""
+
+    def context() -> Generator[Any, Any, int]:
+        value = yield from invalid
+        return value
+
+    return context
+
+
+def validate(invalid: Either[str, int], /) -> Callable[[int], EitherDo[str, int]]:
+    def context(value: int, /) -> EitherDo[str, int]:
+        number = yield from Right(value)
+        positive = yield from (Right(number) if 0 < number else invalid)
+        even = yield from (Right(positive) if positive % 2 == 0 else invalid)
+        return even
+
+    return context
+
+
+def main() -> None:
+    cases = (
+        ("Either.do", Either.do, Left("invalid"), RaisingLeft("invalid"), short_circuit, ()),
+        ("Try.do", Try.do, Failure(ValueError()), RaisingFailure(ValueError()), short_circuit, ()),
+        ("validate", Either.do, Left("invalid"), RaisingLeft("invalid"), validate, (-1,)),
+    )
+    for name, do, invalid, raising, build, arguments in cases:
+        timings = {
+            "raising": do(build(raising)),
+            "yielding": do(build(invalid)),
+            "unchecked": do(unchecked=True)(build(invalid)),
+        }
+        for label, context in timings.items():
+            assert context(*arguments).short_circuit
+            seconds = min(repeat(lambda: context(*arguments), number=NUMBER, repeat=REPEAT))
+            print(f"{name:<10} {label:<10} {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""NumericVector benchmarks
+
+poetry run python benchmarks/numeric_vector.py
+"""
+import tracemalloc
+from random import random
+from timeit import timeit
+from typing import Any, Callable
+
+from pycategory import FloatVector, Vector
+
+SIZE = 1_000_000
+
+
+def allocated(factory: Callable[[], Any], /) -> int:
+    tracemalloc.start()
+    _ = factory()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    elements = [random() for _ in range(SIZE)]
+    boxed_size = allocated(lambda: Vector([element * 2 for element in elements]))
+    unboxed_size = allocated(lambda: FloatVector([element * 2 for element in elements]))
+    print(f"SIZE = {SIZE}")
+    print(f"{'memory Vector':<32}{boxed_size / 2**20:>10.2f} MiB")
+    print(f"{'memory FloatVector':<32}{unboxed_size / 2**20:>10.2f} MiB")
+
+    vector = Vector(elements)
+    float_vector = FloatVector(elements)
+    for name, boxed, unboxed in [
+        ("sum", lambda: sum(vector), float_vector.sum),
+        ("max", lambda: max(vector), float_vector.max),
+        ("mean", lambda: sum(vector) / len(vector), float_vector.mean),
+    ]:
+        boxed_seconds = timeit(boxed, number=10) / 10
+        unboxed_seconds = timeit(unboxed, number=10) / 10
+        print(f"{name + ' Vector':<32}{boxed_seconds * 1000:>10.2f} ms")
+        print(f"{name + ' FloatVector':<32}{unboxed_seconds * 1000:>10.2f} ms")
+
+    for name, function_ in [
+        ("map", lambda: float_vector.map(lambda x: x * 2)),
+        ("map vectorized", lambda: float_vector.map(lambda x: x * 2, vectorized=True)),
+        ("filter", lambda: float_vector.filter(lambda x: 0.5 < x)),
+        ("filter vectorized", lambda: float_vector.filter(lambda x: 0.5 < x, vectorized=True)),
+    ]:
+        seconds = timeit(function_, number=1)
+        print(f"{name + ' FloatVector':<32}{seconds * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Vector benchmarks
+
+poetry run python benchmarks/vector.py
+"""
+from timeit import timeit
+from typing import TypeVar
+
+from pycategory import Vector
+
+T = TypeVar("T")
+
+SIZE = 20_000
+
+
+class ListCopyVector(list[T]):
+    """Previous implementation: every update copies the whole list."""
+
+    def append(self, obj: T, /) -> "ListCopyVector[T]":  # type: ignore
+        sequence = list(self)
+        sequence.append(obj)
+        return self.__class__(sequence)
+
+    def pop(self, index: int, /) -> "ListCopyVector[T]":  # type: ignore
+        sequence = list(self)
+        sequence.pop(index)
+        return self.__class__(sequence)
+
+    def __add__(self, other: list[T], /) -> "ListCopyVector[T]":  # type: ignore
+        sequence = list(self)
+        return self.__class__(sequence.__add__(other))
+
+    def updated(self, index: int, obj: T, /) -> "ListCopyVector[T]":
+        sequence = list(self)
+        sequence[index] = obj
+        return self.__class__(sequence)
+
+
+def append(factory: type, /) -> None:
+    vector = factory()
+    for element in range(SIZE):
+        vector = vector.append(element)
+
+
+def pop(vector: Vector[int] | ListCopyVector[int], /) -> None:
+    for _ in range(SIZE):
+        vector = vector.pop(-1)
+
+
+def updated(vector: Vector[int] | ListCopyVector[int], /) -> None:
+    for index in range(SIZE):
+        vector = vector.updated(index, -index)
+
+
+def concat(factory: type, /) -> None:
+    chunk = factory(range(100))
+    vector = factory()
+    for _ in range(SIZE // 100):
+        vector = vector + chunk
+
+
+def builder() -> None:
+    builder = Vector[int].new_builder()
+    for element in range(SIZE):
+        builder.add_one(element)
+    builder.result()
+
+
+def report(name: str, seconds: float, baseline: float, /) -> None:
+    print(f"{name:<32}{seconds * 1000:>10.2f} ms{baseline / seconds:>10.1f}x")
+
+
+def main() -> None:
+    print(f"{'SIZE = ' + str(SIZE):<32}{'time':>13}{'speedup':>11}")
+    cases = [
+        ("append", lambda: append(ListCopyVector), lambda: append(Vector)),
+        (
+            "pop",
+            lambda: pop(ListCopyVector(range(SIZE))),
+            lambda: pop(Vector(range(SIZE))),
+        ),
+        (
+            "updated",
+            lambda: updated(ListCopyVector(range(SIZE))),
+            lambda: updated(Vector(range(SIZE))),
+        ),
+        ("builder", lambda: append(ListCopyVector), builder),
+        ("concat", lambda: concat(ListCopyVector), lambda: concat(Vector)),
+    ]
+    for name, list_copy, trie in cases:
+        baseline = timeit(list_copy, number=1)
+        report(f"{name} (list copy)", baseline, baseline)
+        report(f"{name} (trie)", timeit(trie, number=1), baseline)
+
+
+if __name__ == "__main__":
+    main()
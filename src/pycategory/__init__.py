@@ -1,4 +1,4 @@
-from .collection import Vector
+from .collection import FloatVector, IntVector, SortedVector, TreeMap, Vector
 from .constraints import SubtypeConstraints
 from .either import Either, EitherDo, Left, LeftProjection, Right, RightProjection
 from .extension import Extension
@@ -9,10 +9,15 @@ from .monad import Monad
 from .option import VOID, Option, OptionDo, Some, Void
 from .pipeline import Pipeline
 from .processor import Frame
+from .sink import JsonLinesSink
 from .try_ import Failure, Success, Try, TryDo
 
 __all__ = [
     "Vector",
+    "IntVector",
+    "FloatVector",
+    "SortedVector",
+    "TreeMap",
     "SubtypeConstraints",
     "Either",
     "EitherDo",
@@ -33,6 +38,7 @@ __all__ = [
     "VOID",
     "Pipeline",
     "Frame",
+    "JsonLinesSink",
     "Failure",
     "Success",
     "Try",
@@ -17,6 +17,8 @@ class Applicative(functor.Functor[Ap]):
         (<*>) :: f (a -> b) -> f a -> f b
     """
 
+    __slots__ = ()
+
     @staticmethod
     def pure(value: A) -> Applicative[A]:
         raise NotImplementedError()
@@ -1,93 +1,744 @@
 from __future__ import annotations
 
+import heapq
+import os
 import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Executor, ThreadPoolExecutor
 from functools import reduce
-from typing import Any, Callable, Iterable, NoReturn, Optional, TypeVar, cast
+from itertools import chain, islice, repeat
+from operator import countOf, itemgetter
+from statistics import fmean
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    ItemsView,
+    Iterable,
+    Iterator,
+    Mapping,
+    NoReturn,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+    overload,
+)
+
+from . import option
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional
+    numpy = None  # type: ignore
 
 T = TypeVar("T")
 A = TypeVar("A")
+K = TypeVar("K")
+V = TypeVar("V")
+N = TypeVar("N", int, float)
+
+BITS = 5
+WIDTH = 1 << BITS
+INDEX_MASK = WIDTH - 1
+
+
+class _Storage:
+    """Persistent storage behind a Vector
+
+    Writes that a storage cannot perform in place of its own structure
+    are delegated to a forced trie copy.
+    """
+
+    __slots__ = ("size",)
+
+    size: int
+
+    def get(self, index: int, /) -> Any:
+        raise NotImplementedError()
+
+    def __iter__(self) -> Iterator[Any]:
+        raise NotImplementedError()
+
+    def __reversed__(self) -> Iterator[Any]:
+        raise NotImplementedError()
+
+    def __contains__(self, obj: object, /) -> bool:
+        return any(element is obj or element == obj for element in self)
+
+    def force(self) -> _Trie:
+        raise NotImplementedError()
+
+    def copy(self) -> _Storage:
+        return self.force()
+
+    def slice(self, start: int, step: int, size: int, /) -> _Storage:
+        if size == 0:
+            return EMPTY_TRIE
+        if start == 0 and step == 1 and size == self.size:
+            return self
+        return _Slice(self.force(), start, step, size)
+
+    def append(self, obj: Any, /) -> _Storage:
+        return self.force().append(obj)
+
+    def extend(self, items: Iterable[Any], /) -> _Storage:
+        return self.force().extend(items)
+
+    def concat(self, other: _Storage, /) -> _Storage:
+        """Join without copying, unless the other storage is small or typed."""
+        if isinstance(other, _Array) or other.size < WIDTH:
+            return self.extend(other)
+        return _join(self, other)
+
+    def updated(self, index: int, obj: Any, /) -> _Storage:
+        return self.force().updated(index, obj)
+
+    def pop_last(self) -> _Storage:
+        return self.force().pop_last()
+
+
+class _Trie(_Storage):
+    """Persistent bit-partitioned vector trie
+
+    Elements are stored in leaves of WIDTH slots. The last leaf is kept apart as the tail,
+    so append and pop of the last element usually only copy the tail.
+    Nodes are tuples and are never mutated, which lets every version share its structure.
+
+    see: https://hypirion.com/musings/understanding-persistent-vector-pt-1
+    """
+
+    __slots__ = ("shift", "root", "tail")
+
+    def __init__(self, size: int, shift: int, root: tuple[Any, ...], tail: tuple[Any, ...]):
+        self.size = size
+        self.shift = shift
+        self.root = root
+        self.tail = tail
+
+    @staticmethod
+    def from_iterable(items: Iterable[Any], /) -> _Trie:
+        """Build bottom-up in a single pass."""
+        elements = items if isinstance(items, (list, tuple)) else tuple(items)
+        size = len(elements)
+        if size == 0:
+            return EMPTY_TRIE
+        tail_offset = _tail_offset(size)
+        nodes: list[Any] = [
+            tuple(elements[start : start + WIDTH]) for start in range(0, tail_offset, WIDTH)
+        ]
+        shift = BITS
+        while WIDTH < len(nodes):
+            nodes = [tuple(nodes[start : start + WIDTH]) for start in range(0, len(nodes), WIDTH)]
+            shift += BITS
+        return _Trie(size, shift, tuple(nodes), tuple(elements[tail_offset:]))
+
+    def leaf_for(self, index: int, /) -> tuple[Any, ...]:
+        if _tail_offset(self.size) <= index:
+            return self.tail
+        node = self.root
+        level = self.shift
+        while 0 < level:
+            node = node[(index >> level) & INDEX_MASK]
+            level -= BITS
+        return node
+
+    def get(self, index: int, /) -> Any:
+        return self.leaf_for(index)[index & INDEX_MASK]
+
+    def leaves(self) -> Iterator[tuple[Any, ...]]:
+        def walk(node: tuple[Any, ...], level: int) -> Iterator[tuple[Any, ...]]:
+            if level == 0:
+                yield node
+            else:
+                for child in node:
+                    yield from walk(child, level - BITS)
+
+        yield from walk(self.root, self.shift)
+        if self.tail:
+            yield self.tail
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self.leaves())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return chain.from_iterable(reversed(leaf) for leaf in reversed(tuple(self.leaves())))
+
+    def __contains__(self, obj: object, /) -> bool:
+        return any(obj in leaf for leaf in self.leaves())
+
+    def force(self) -> _Trie:
+        return self
+
+    def append(self, obj: Any, /) -> _Trie:
+        if len(self.tail) < WIDTH:
+            return _Trie(self.size + 1, self.shift, self.root, self.tail + (obj,))
+        root, shift = self._pushed_tail()
+        return _Trie(self.size + 1, shift, root, (obj,))
+
+    def extend(self, items: Iterable[Any], /) -> _Trie:
+        """Fill the tail and push whole leaves, without an intermediate version per element."""
+        elements = items if isinstance(items, (list, tuple)) else tuple(items)
+        trie = self
+        start = 0
+        while start < len(elements):
+            if len(trie.tail) == WIDTH:
+                root, shift = trie._pushed_tail()
+                stop = start + WIDTH
+                chunk = tuple(elements[start:stop])
+                trie = _Trie(trie.size + len(chunk), shift, root, chunk)
+            else:
+                stop = start + WIDTH - len(trie.tail)
+                chunk = tuple(elements[start:stop])
+                trie = _Trie(trie.size + len(chunk), trie.shift, trie.root, trie.tail + chunk)
+            start = stop
+        return trie
+
+    def updated(self, index: int, obj: Any, /) -> _Trie:
+        tail_offset = _tail_offset(self.size)
+        if tail_offset <= index:
+            position = index - tail_offset
+            tail = self.tail[:position] + (obj,) + self.tail[position + 1 :]
+            return _Trie(self.size, self.shift, self.root, tail)
+
+        def assoc(node: tuple[Any, ...], level: int) -> tuple[Any, ...]:
+            if level == 0:
+                position = index & INDEX_MASK
+                return node[:position] + (obj,) + node[position + 1 :]
+            position = (index >> level) & INDEX_MASK
+            return node[:position] + (assoc(node[position], level - BITS),) + node[position + 1 :]
+
+        return _Trie(self.size, self.shift, assoc(self.root, self.shift), self.tail)
+
+    def pop_last(self) -> _Trie:
+        if self.size <= 1:
+            return EMPTY_TRIE
+        if 1 < len(self.tail):
+            return _Trie(self.size - 1, self.shift, self.root, self.tail[:-1])
+        tail = self.leaf_for(self.size - 2)
+
+        def pop_tail(node: tuple[Any, ...], level: int) -> Optional[tuple[Any, ...]]:
+            position = ((self.size - 2) >> level) & INDEX_MASK
+            if BITS < level:
+                child = pop_tail(node[position], level - BITS)
+                if child is None and position == 0:
+                    return None
+                return node[:position] if child is None else node[:position] + (child,)
+            return None if position == 0 else node[:position]
+
+        root = pop_tail(self.root, self.shift) or ()
+        shift = self.shift
+        if BITS < shift and len(root) == 1:
+            root = root[0]
+            shift -= BITS
+        return _Trie(self.size - 1, shift, root, tail)
+
+    def _pushed_tail(self) -> tuple[tuple[Any, ...], int]:
+        """Move the full tail into the tree and return the new root and shift."""
+
+        def new_path(level: int, node: tuple[Any, ...]) -> tuple[Any, ...]:
+            return node if level == 0 else (new_path(level - BITS, node),)
+
+        def push_tail(node: tuple[Any, ...], level: int) -> tuple[Any, ...]:
+            position = ((self.size - 1) >> level) & INDEX_MASK
+            if level == BITS:
+                child = self.tail
+            elif position < len(node):
+                child = push_tail(node[position], level - BITS)
+            else:
+                child = new_path(level - BITS, self.tail)
+            return node[:position] + (child,) + node[position + 1 :]
+
+        if (1 << self.shift) < (self.size >> BITS):
+            return (self.root, new_path(self.shift, self.tail)), self.shift + BITS
+        return push_tail(self.root, self.shift), self.shift
+
+
+def _tail_offset(size: int, /) -> int:
+    return 0 if size < WIDTH else ((size - 1) >> BITS) << BITS
+
+
+EMPTY_TRIE = _Trie(0, BITS, (), ())
+
+
+class _Slice(_Storage):
+    """Offset and stride window over a trie
+
+    Shares the trie of the sliced Vector instead of copying its elements.
+    """
+
+    __slots__ = ("base", "start", "step")
+
+    def __init__(self, base: _Trie, start: int, step: int, size: int):
+        self.base = base
+        self.start = start
+        self.step = step
+        self.size = size
+
+    def get(self, index: int, /) -> Any:
+        return self.base.get(self.start + index * self.step)
+
+    def chunks(self) -> Iterator[tuple[Any, ...]]:
+        """Leaf slices of a contiguous window."""
+        position = self.start
+        stop = self.start + self.size
+        while position < stop:
+            offset = position & INDEX_MASK
+            chunk = self.base.leaf_for(position)[offset : offset + stop - position]
+            yield chunk
+            position += len(chunk)
+
+    def mirror(self) -> _Slice:
+        return _Slice(self.base, self.start + (self.size - 1) * self.step, -self.step, self.size)
+
+    def __iter__(self) -> Iterator[Any]:
+        match self.step:
+            case 1:
+                return chain.from_iterable(self.chunks())
+            case -1:
+                chunks = tuple(self.mirror().chunks())
+                return chain.from_iterable(reversed(chunk) for chunk in reversed(chunks))
+            case _:
+                stop = self.start + self.size * self.step
+                return map(self.base.get, range(self.start, stop, self.step))
+
+    def __reversed__(self) -> Iterator[Any]:
+        return iter(self.mirror())
+
+    def __contains__(self, obj: object, /) -> bool:
+        if self.step == 1:
+            return any(obj in chunk for chunk in self.chunks())
+        return super().__contains__(obj)
+
+    def force(self) -> _Trie:
+        return _Trie.from_iterable(self)
+
+    def slice(self, start: int, step: int, size: int, /) -> _Storage:
+        if size == 0:
+            return EMPTY_TRIE
+        start = self.start + start * self.step
+        step = self.step * step
+        if start == 0 and step == 1 and size == self.base.size:
+            return self.base
+        return _Slice(self.base, start, step, size)
+
+    def pop_last(self) -> _Storage:
+        return self.slice(0, 1, self.size - 1)
+
+
+class _Array(_Storage):
+    """Read-only memoryview over a typed array
+
+    Elements are stored unboxed. Slices share the buffer, other updates copy it.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: memoryview):
+        self.data = data
+        self.size = len(data)
+
+    @staticmethod
+    def from_iterable(typecode: str, items: Iterable[Any], /) -> _Array:
+        return _Array.wrap(array(typecode, items))
+
+    @staticmethod
+    def wrap(buffer: array[Any], /) -> _Array:
+        return _Array(memoryview(buffer).toreadonly())
+
+    def copied(self) -> array[Any]:
+        return array(self.data.format, self.data.tobytes())
+
+    def get(self, index: int, /) -> Any:
+        return self.data[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.data)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return iter(self.data[::-1])
+
+    def force(self) -> _Trie:
+        return _Trie.from_iterable(self.data.tolist())
+
+    def copy(self) -> _Storage:
+        return _Array.wrap(self.copied())
+
+    def slice(self, start: int, step: int, size: int, /) -> _Storage:
+        stop = start + size * step
+        return _Array(self.data[start : stop if 0 <= stop else None : step])
+
+    def append(self, obj: Any, /) -> _Storage:
+        buffer = self.copied()
+        buffer.append(obj)
+        return _Array.wrap(buffer)
+
+    def extend(self, items: Iterable[Any], /) -> _Storage:
+        buffer = self.copied()
+        buffer.extend(items)
+        return _Array.wrap(buffer)
+
+    def concat(self, other: _Storage, /) -> _Storage:
+        return self.extend(other)
+
+    def updated(self, index: int, obj: Any, /) -> _Storage:
+        buffer = self.copied()
+        buffer[index] = obj
+        return _Array.wrap(buffer)
+
+    def pop_last(self) -> _Storage:
+        return _Array(self.data[:-1])
+
+    @staticmethod
+    def from_ndarray(typecode: str, ndarray: Any, /) -> _Array:
+        """Share the buffer of a NumPy array without copying."""
+        contiguous = numpy.ascontiguousarray(ndarray)  # type: ignore
+        return _Array(memoryview(contiguous).cast("B").cast(typecode).toreadonly())
+
 
+class _Concat(_Storage):
+    """Concatenation node
 
-class Vector(list[T]):
+    Nodes form an AVL balanced tree over the other storages, so concatenation
+    takes O(log n) without copying elements. Index access walks the tree in
+    O(log n), slices are taken from a flattened trie copy.
+    """
+
+    __slots__ = ("left", "right", "height")
+
+    def __init__(self, left: _Storage, right: _Storage):
+        self.left = left
+        self.right = right
+        self.size = left.size + right.size
+        self.height = 1 + max(_height(left), _height(right))
+
+    def parts(self) -> Iterator[_Storage]:
+        for child in (self.left, self.right):
+            if isinstance(child, _Concat):
+                yield from child.parts()
+            else:
+                yield child
+
+    def get(self, index: int, /) -> Any:
+        node: _Storage = self
+        while isinstance(node, _Concat):
+            if index < node.left.size:
+                node = node.left
+            else:
+                index -= node.left.size
+                node = node.right
+        return node.get(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self.parts())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return chain.from_iterable(reversed(part) for part in reversed(tuple(self.parts())))
+
+    def __contains__(self, obj: object, /) -> bool:
+        return any(obj in part for part in self.parts())
+
+    def force(self) -> _Trie:
+        return _Trie.from_iterable(self)
+
+    def append(self, obj: Any, /) -> _Storage:
+        return _join(self.left, self.right.append(obj))
+
+    def extend(self, items: Iterable[Any], /) -> _Storage:
+        return _join(self.left, self.right.extend(items))
+
+    def updated(self, index: int, obj: Any, /) -> _Storage:
+        if index < self.left.size:
+            return _Concat(self.left.updated(index, obj), self.right)
+        return _Concat(self.left, self.right.updated(index - self.left.size, obj))
+
+    def pop_last(self) -> _Storage:
+        return _join(self.left, self.right.pop_last())
+
+
+def _height(storage: _Storage, /) -> int:
+    return storage.height if isinstance(storage, _Concat) else 0
+
+
+def _join(left: _Storage, right: _Storage, /) -> _Storage:
+    """Concatenate two balanced trees of any height."""
+    if left.size == 0:
+        return right
+    if right.size == 0:
+        return left
+    if _height(right) + 1 < _height(left):
+        left = cast(_Concat, left)
+        return _balance(left.left, _join(left.right, right))
+    if _height(left) + 1 < _height(right):
+        right = cast(_Concat, right)
+        return _balance(_join(left, right.left), right.right)
+    return _Concat(left, right)
+
+
+def _balance(left: _Storage, right: _Storage, /) -> _Concat:
+    """Rotate when the heights of the children differ by two."""
+    if _height(right) + 1 < _height(left):
+        left = cast(_Concat, left)
+        if _height(left.right) <= _height(left.left):
+            return _Concat(left.left, _Concat(left.right, right))
+        inner = cast(_Concat, left.right)
+        return _Concat(_Concat(left.left, inner.left), _Concat(inner.right, right))
+    if _height(left) + 1 < _height(right):
+        right = cast(_Concat, right)
+        if _height(right.left) <= _height(right.right):
+            return _Concat(_Concat(left, right.left), right.right)
+        inner = cast(_Concat, right.left)
+        return _Concat(_Concat(left, inner.left), _Concat(inner.right, right.right))
+    return _Concat(left, right)
+
+
+def _balanced(parts: Sequence[_Storage], /) -> _Storage:
+    """Build a balanced tree over parts in order."""
+
+    def build(start: int, stop: int) -> _Storage:
+        if stop - start == 1:
+            return parts[start]
+        middle = (start + stop) // 2
+        return _Concat(build(start, middle), build(middle, stop))
+
+    return build(0, len(parts)) if parts else EMPTY_TRIE
+
+
+class Vector(Sequence[T]):
     """Immutable Collection
 
+    Backed by a persistent trie, so append, updated and pop of the last element
+    are effectively constant time and every previous version stays valid.
+    Slices, take, drop, tail and reverse are views sharing the same trie
+    until copy or an update forces them into a trie of their own.
+    Concatenation with another Vector joins both without copying elements.
+    Hashable when its elements are, with the hash computed once per instance.
+
+    A Sequence but not a list: isinstance(vector, list) is False, and json and
+    dataclasses.asdict keep it as a Vector, so serialize list(vector) instead.
+
     see: https://docs.python.org/3.9/library/collections.abc.html#collections.abc.Sequence
+    see: https://www.scala-lang.org/api/current/scala/collection/immutable/Vector.html
     """
 
-    def __init__(self, items: Optional[list[T] | tuple[T, ...] | tuple[()]] = None):
-        if items is None:
-            items = list()
-        list[T].__init__(self, items)
+    __slots__ = ("_storage", "_hash")
+
+    def __init__(self, items: Optional[Iterable[T]] = None):
+        self._storage: _Storage = self._build_storage(() if items is None else items)
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def _build_storage(cls, items: Iterable[Any], /) -> _Storage:
+        return _Trie.from_iterable(items)
+
+    @classmethod
+    def _from_storage(cls, storage: _Storage, /) -> Vector[T]:
+        instance = cls.__new__(cls)
+        instance._storage = storage
+        instance._hash = None
+        return instance
+
+    @classmethod
+    def _coerce(cls, items: Iterable[Any], /) -> Vector[Any]:
+        """Build the result of an element type changing operation."""
+        return cls(items)
+
+    @classmethod
+    def concat_all(cls, vectors: Iterable[Iterable[T]], /) -> Vector[T]:
+        """Concatenate in one pass.
+
+        Large Vectors are joined as they are, everything else is packed into tries.
+        """
+        parts: list[_Storage] = []
+        pending: list[T] = []
+        for items in vectors:
+            match items:
+                case Vector() if WIDTH <= len(items) and not isinstance(items._storage, _Array):
+                    if pending:
+                        parts.append(_Trie.from_iterable(pending))
+                        pending = []
+                    if isinstance(items._storage, _Concat):
+                        parts.extend(items._storage.parts())
+                    else:
+                        parts.append(items._storage)
+                case _:
+                    pending.extend(items)
+        if pending:
+            parts.append(_Trie.from_iterable(pending))
+        return cls._from_storage(_balanced(parts))
+
+    @classmethod
+    def new_builder(cls) -> VectorBuilder[T]:
+        return VectorBuilder(factory=cls)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({[element for element in self]})"
 
-    def __add__(self, other: list[T], /) -> Vector[T]:  # type: ignore
-        sequence = list(self)
-        return self.__class__(sequence.__add__(other))
+    def __reduce__(self) -> tuple[Type[Vector[T]], tuple[tuple[T, ...]]]:
+        return (self.__class__, (tuple(self),))
+
+    def __len__(self) -> int:
+        return self._storage.size
+
+    @overload
+    def __getitem__(self, index: int, /) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice, /) -> Vector[T]:
+        ...
+
+    def __getitem__(self, index: int | slice, /) -> T | Vector[T]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            size = len(range(start, stop, step))
+            return self._from_storage(self._storage.slice(start, step, size))
+        size = len(self)
+        position = index + size if index < 0 else index
+        if not 0 <= position < size:
+            raise IndexError("Vector index out of range")
+        return self._storage.get(position)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._storage)
+
+    def __contains__(self, obj: object, /) -> bool:
+        return obj in self._storage
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __eq__(self, other: object, /) -> bool:
+        match other:
+            case Vector():
+                if self is other or self._storage is other._storage:
+                    return True
+                if len(self) != len(other):
+                    return False
+                if None not in (self._hash, other._hash) and self._hash != other._hash:
+                    return False
+                return tuple(self) == tuple(other)
+            case list():
+                return len(self) == len(other) and list(self) == other
+            case _:
+                return NotImplemented
+
+    def __lt__(self, other: Vector[T] | list[T], /) -> bool:
+        return list(self) < list(other)
 
-    def __setitem__(self, slice_: slice, item: Iterable[T]) -> NoReturn:  # type: ignore
+    def __le__(self, other: Vector[T] | list[T], /) -> bool:
+        return list(self) <= list(other)
+
+    def __gt__(self, other: Vector[T] | list[T], /) -> bool:
+        return list(self) > list(other)
+
+    def __ge__(self, other: Vector[T] | list[T], /) -> bool:
+        return list(self) >= list(other)
+
+    def __add__(self, other: Vector[T] | list[T], /) -> Vector[T]:
+        match other:
+            case Vector():
+                return self._from_storage(self._storage.concat(other._storage))
+            case list():
+                return self._from_storage(self._storage.extend(other))
+            case _:
+                return NotImplemented
+
+    def __radd__(self, other: list[T], /) -> list[T]:
+        """Keep list semantics for mutable + immutable."""
+        if not isinstance(other, list):
+            return NotImplemented
+        return other + list(self)
+
+    def __mul__(self, times: int, /) -> Vector[T]:
+        return self.__class__(tuple(self) * times)
+
+    __rmul__ = __mul__
+
+    def __setitem__(self, slice_: slice, item: Iterable[T]) -> NoReturn:
         raise TypeError("Does not support the __setitem__ method")
 
-    def __delitem__(self, slice_: slice) -> NoReturn:  # type: ignore
+    def __delitem__(self, slice_: slice) -> NoReturn:
         raise TypeError("Does not support the __delitem__ method")
 
-    def append(self, obj: T, /) -> Vector[T]:  # type: ignore
-        sequence = list(self)
-        sequence.append(obj)
-        return self.__class__(sequence)
+    def append(self, obj: T, /) -> Vector[T]:
+        return self._from_storage(self._storage.append(obj))
 
-    def extend(self, items: Iterable[T], /) -> Vector[T]:  # type: ignore
-        sequence = list(self)
-        sequence.extend(items)
-        return self.__class__(sequence)
+    def extend(self, items: Iterable[T], /) -> Vector[T]:
+        if isinstance(items, Vector):
+            return self._from_storage(self._storage.concat(items._storage))
+        return self._from_storage(self._storage.extend(items))
+
+    def updated(self, index: int, obj: T, /) -> Vector[T]:
+        size = len(self)
+        position = index + size if index < 0 else index
+        if not 0 <= position < size:
+            raise IndexError("Vector index out of range")
+        return self._from_storage(self._storage.updated(position, obj))
 
-    def insert(self, *, index: int, obj: T) -> Vector[T]:  # type: ignore
+    def insert(self, *, index: int, obj: T) -> Vector[T]:
+        if len(self) <= index:
+            return self.append(obj)
         sequence = list(self)
         sequence.insert(index, obj)
         return self.__class__(sequence)
 
-    def remove(self, obj: Any, /) -> Vector[T]:  # type: ignore
-        sequence = list(self)
-        sequence.remove(obj)
-        return self.__class__(sequence)
+    def remove(self, obj: Any, /) -> Vector[T]:
+        return self.pop(self.index(obj=obj))
 
-    def pop(self, index: int, /) -> Vector[T]:  # type: ignore
+    def pop(self, index: int, /) -> Vector[T]:
+        if index in (-1, len(self) - 1) and self.non_empty():
+            return self._from_storage(self._storage.pop_last())
         sequence = list(self)
         sequence.pop(index)
         return self.__class__(sequence)
 
-    def clear(self) -> None:
+    def clear(self) -> NoReturn:
         raise TypeError("Does not support the clear method")
 
     def index(self, *, obj: T, start: int = 0, end: int = sys.maxsize) -> int:  # type: ignore
-        return list[T].index(self, obj, start, end)
+        start, end, _ = slice(start, end).indices(len(self))
+        for position, element in enumerate(islice(self, start, end), start):
+            if element is obj or element == obj:
+                return position
+        raise ValueError(f"{obj!r} is not in {self.__class__.__name__}")
 
     def count(self, obj: T, /) -> int:
-        return list[T].count(self, obj)
+        return countOf(self, obj)
 
-    def sort(  # type: ignore
+    def sort(
         self,
         *,
-        key: Optional[T] = None,
+        key: Optional[Callable[[T], Any]] = None,
         reverse: bool = False,
     ) -> Vector[T]:
-        sequence = list(self)
-        sequence.sort(key=key, reverse=reverse)  # type: ignore
-        return self.__class__(sequence)
+        return self.__class__(sorted(self, key=key, reverse=reverse))  # type: ignore
 
     def __reversed__(self) -> Vector[T]:  # type: ignore
-        sequence = list(self)
-        sequence.reverse()
-        return self.__class__(sequence)
+        return self[::-1]
 
-    def reverse(self) -> Vector[T]:  # type: ignore
-        sequence = list(self)
-        sequence.reverse()
-        return self.__class__(sequence)
+    def reverse(self) -> Vector[T]:
+        return self[::-1]
+
+    def take(self, size: int, /) -> Vector[T]:
+        return self[: max(size, 0)]
+
+    def drop(self, size: int, /) -> Vector[T]:
+        return self[max(size, 0) :]
+
+    def tail(self) -> Vector[T]:
+        if self.is_empty():
+            raise ValueError(self)
+        return self[1:]
 
     def copy(self) -> Vector[T]:
-        return self.__class__(list(self))
+        """Detach from the storage of a sliced Vector."""
+        return self._from_storage(self._storage.copy())
 
     def is_empty(self) -> bool:
         return 0 == len(self)
@@ -99,10 +750,838 @@ class Vector(list[T]):
         return len(self)
 
     def map(self, function_: Callable[[T], A], /) -> Vector[A]:
-        return cast(Vector[A], self.__class__([function_(element) for element in self]))
+        return cast("Vector[A]", self._coerce([function_(element) for element in self]))
 
     def reduce(self, function: Callable[[T, T], T], /) -> T:
         return reduce(function, self)
 
     def filter(self, function: Callable[[T], bool], /) -> Vector[T]:
         return self.__class__([element for element in self if function(element)])
+
+    def view(self) -> VectorView[T]:
+        return VectorView(source=self, factory=self.__class__)
+
+    def indexed(self) -> IndexedVector[T]:
+        storage = self._storage.force() if isinstance(self._storage, _Array) else self._storage
+        return cast("IndexedVector[T]", IndexedVector._from_storage(storage))
+
+    def _chunks(self, chunksize: Optional[int], /) -> list[Vector[T]]:
+        if chunksize is None:
+            chunksize = max(1, -(-len(self) // ((os.cpu_count() or 1) * CHUNKS_PER_WORKER)))
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1", chunksize)
+        return [self[start : start + chunksize] for start in range(0, len(self), chunksize)]
+
+    def par_map(
+        self,
+        function_: Callable[[T], A],
+        /,
+        *,
+        executor: Optional[Executor] = None,
+        chunksize: Optional[int] = None,
+    ) -> Vector[A]:
+        """map on chunks in an executor, preserving order.
+
+        Uses a temporary thread pool by default.
+        A ProcessPoolExecutor requires a picklable function.
+        """
+        if executor is None:
+            with ThreadPoolExecutor() as default_executor:
+                return self.par_map(function_, executor=default_executor, chunksize=chunksize)
+        chunks = self._chunks(chunksize)
+        results = executor.map(_map_chunk, repeat(function_), chunks)
+        return cast("Vector[A]", self._coerce(chain.from_iterable(results)))
+
+    def par_reduce(
+        self,
+        function: Callable[[T, T], T],
+        /,
+        *,
+        executor: Optional[Executor] = None,
+        chunksize: Optional[int] = None,
+    ) -> T:
+        """reduce on chunks in an executor, then combine partial results tree-wise.
+
+        The function must be associative. Uses a temporary thread pool by default.
+        """
+        if self.is_empty():
+            raise TypeError("reduce() of empty sequence with no initial value")
+        if executor is None:
+            with ThreadPoolExecutor() as default_executor:
+                return self.par_reduce(function, executor=default_executor, chunksize=chunksize)
+        partials = list(executor.map(_reduce_chunk, repeat(function), self._chunks(chunksize)))
+        while 1 < len(partials):
+            rest = partials[-1:] if len(partials) % 2 else []
+            partials = list(executor.map(function, partials[0::2], partials[1::2])) + rest
+        return partials[0]
+
+
+CHUNKS_PER_WORKER = 4
+
+
+def _map_chunk(function_: Callable[[Any], Any], chunk: Vector[Any], /) -> list[Any]:
+    return [function_(element) for element in chunk]
+
+
+def _reduce_chunk(function: Callable[[Any, Any], Any], chunk: Vector[Any], /) -> Any:
+    return reduce(function, chunk)
+
+
+class VectorView(Generic[T]):
+    """Lazy view
+
+    Records map, filter, flat_map, take and drop steps and runs them
+    in a single pass without intermediate collections when iterated or forced.
+
+    see: https://www.scala-lang.org/api/current/scala/collection/SeqView.html
+    """
+
+    def __init__(
+        self,
+        *,
+        source: Iterable[Any],
+        factory: Type[Vector[Any]] = Vector,
+        steps: tuple[tuple[str, Any], ...] = (),
+    ):
+        self._source = source
+        self._factory = factory
+        self._steps = steps
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<not computed>)"
+
+    def __iter__(self) -> Iterator[T]:
+        iterator: Iterator[Any] = iter(self._source)
+        for step, argument in self._steps:
+            match step:
+                case "map":
+                    iterator = map(argument, iterator)
+                case "filter":
+                    iterator = filter(argument, iterator)
+                case "flat_map":
+                    iterator = chain.from_iterable(map(argument, iterator))
+                case "take":
+                    iterator = islice(iterator, argument)
+                case "drop":
+                    iterator = islice(iterator, argument, None)
+                case _:
+                    raise ValueError(step)
+        return iterator
+
+    def _step(self, step: str, argument: Any, /) -> VectorView[Any]:
+        return VectorView(
+            source=self._source, factory=self._factory, steps=self._steps + ((step, argument),)
+        )
+
+    def map(self, function_: Callable[[T], A], /) -> VectorView[A]:
+        return self._step("map", function_)
+
+    def filter(self, function: Callable[[T], bool], /) -> VectorView[T]:
+        return self._step("filter", function)
+
+    def flat_map(self, function_: Callable[[T], Iterable[A]], /) -> VectorView[A]:
+        return self._step("flat_map", function_)
+
+    def take(self, size: int, /) -> VectorView[T]:
+        return self._step("take", max(size, 0))
+
+    def drop(self, size: int, /) -> VectorView[T]:
+        return self._step("drop", max(size, 0))
+
+    def to_vector(self) -> Vector[T]:
+        return cast("Vector[T]", self._factory._coerce(self))
+
+
+class VectorBuilder(Generic[T]):
+    """Transient builder
+
+    Buffers elements and builds the trie once on result, for bulk construction.
+    """
+
+    def __init__(self, *, factory: Type[Vector[T]] = Vector):
+        self._factory = factory
+        self._buffer: list[T] = []
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def add_one(self, obj: T, /) -> VectorBuilder[T]:
+        self._buffer.append(obj)
+        return self
+
+    def add_all(self, items: Iterable[T], /) -> VectorBuilder[T]:
+        self._buffer.extend(items)
+        return self
+
+    def clear(self) -> None:
+        self._buffer = []
+
+    def result(self) -> Vector[T]:
+        return self._factory(self._buffer)
+
+
+class _PositionIndex:
+    """Ascending positions by key over the first size elements"""
+
+    __slots__ = ("size", "table")
+
+    def __init__(self, key: Optional[Callable[[Any], Any]], items: Sequence[Any], /):
+        table: dict[Any, list[int]] = {}
+        for position, element in enumerate(items):
+            table.setdefault(element if key is None else key(element), []).append(position)
+        self.size = len(items)
+        self.table = table
+
+
+class IndexedVector(Vector[T]):
+    """Immutable Collection with hash indexes
+
+    in, index, count and remove look up positions in a hash index built lazily on first use.
+    Vectors derived by append, extend, +, take and pop of the last element keep this prefix,
+    so they reuse its indexes and only scan the elements added after it.
+    """
+
+    __slots__ = ("_indexes",)
+
+    def __init__(self, items: Optional[Iterable[T]] = None):
+        super().__init__(items)
+        self._indexes: dict[Optional[Callable[[Any], Any]], Optional[tuple[_PositionIndex, int]]]
+        self._indexes = {}
+
+    @classmethod
+    def _from_storage(cls, storage: _Storage, /) -> Vector[T]:
+        instance = cast("IndexedVector[T]", super()._from_storage(storage))
+        instance._indexes = {}
+        return instance
+
+    def _prefix_of(self, vector: Vector[T], kept: int, /) -> IndexedVector[T]:
+        """Share the built indexes with a Vector that keeps the first kept elements."""
+        derived = cast("IndexedVector[T]", vector)
+        derived._indexes = {
+            key: None if entry is None else (entry[0], min(entry[1], kept))
+            for key, entry in self._indexes.items()
+        }
+        return derived
+
+    def _positions(self, key: Optional[Callable[[T], Any]], value: Any, /) -> Optional[list[int]]:
+        """Positions of value, or None when it cannot be looked up by hash.
+
+        An index is valid for its first positions only; later elements are scanned.
+        """
+        entry = self._indexes.get(key)
+        if key in self._indexes and entry is None:
+            return None
+        if entry is None or WIDTH < len(self) - entry[1]:
+            try:
+                entry = (_PositionIndex(key, self), len(self))
+            except TypeError:
+                entry = None
+            self._indexes[key] = entry
+            if entry is None:
+                return None
+        index, valid = entry
+        valid = min(valid, len(self))
+        try:
+            positions = index.table.get(value, [])
+        except TypeError:
+            return None
+        positions = positions[: bisect_left(positions, valid)]
+        for position in range(valid, len(self)):
+            element = self._storage.get(position)
+            candidate = element if key is None else key(element)
+            if candidate is value or candidate == value:
+                positions.append(position)
+        return positions
+
+    def indexed(self) -> IndexedVector[T]:
+        return self
+
+    def key_by(self, key: Callable[[T], K], /) -> KeyIndex[K, T]:
+        """Secondary index, reused as long as the same key function is passed."""
+        return KeyIndex(vector=self, key=key)
+
+    def __contains__(self, obj: object, /) -> bool:
+        if (positions := self._positions(None, obj)) is None:
+            return super().__contains__(obj)
+        return 0 < len(positions)
+
+    def index(self, *, obj: T, start: int = 0, end: int = sys.maxsize) -> int:  # type: ignore
+        if (positions := self._positions(None, obj)) is None:
+            return super().index(obj=obj, start=start, end=end)
+        start, end, _ = slice(start, end).indices(len(self))
+        found = bisect_left(positions, start)
+        if found < len(positions) and positions[found] < end:
+            return positions[found]
+        raise ValueError(f"{obj!r} is not in {self.__class__.__name__}")
+
+    def count(self, obj: T, /) -> int:
+        if (positions := self._positions(None, obj)) is None:
+            return super().count(obj)
+        return len(positions)
+
+    def append(self, obj: T, /) -> Vector[T]:
+        return self._prefix_of(super().append(obj), len(self))
+
+    def extend(self, items: Iterable[T], /) -> Vector[T]:
+        return self._prefix_of(super().extend(items), len(self))
+
+    def __add__(self, other: Vector[T] | list[T], /) -> Vector[T]:
+        if not isinstance(other, (Vector, list)):
+            return NotImplemented
+        return self._prefix_of(super().__add__(other), len(self))
+
+    def take(self, size: int, /) -> Vector[T]:
+        taken = super().take(size)
+        return self._prefix_of(taken, len(taken))
+
+    def pop(self, index: int, /) -> Vector[T]:
+        popped = super().pop(index)
+        return self._prefix_of(popped, len(popped)) if index in (-1, len(self) - 1) else popped
+
+
+class KeyIndex(Mapping[K, Vector[T]]):
+    """Elements of an IndexedVector grouped by key"""
+
+    def __init__(self, *, vector: IndexedVector[T], key: Callable[[T], K]):
+        self._vector = vector
+        self._key = key
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)})"
+
+    def __getitem__(self, key: K, /) -> Vector[T]:
+        if (positions := self._vector._positions(self._key, key)) is None:
+            raise TypeError(key)
+        if not positions:
+            raise KeyError(key)
+        return Vector(self._vector._storage.get(position) for position in positions)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(dict.fromkeys(map(self._key, self._vector)))
+
+    def __len__(self) -> int:
+        return len(dict.fromkeys(map(self._key, self._vector)))
+
+
+class SortedVector(Vector[T]):
+    """Immutable Collection kept in ascending order
+
+    Lookups binary search the trie instead of scanning it.
+    Adding an element that sorts last is an append, so ordered data such as
+    timestamps is collected in constant time per element; other adds copy.
+    Operations that place elements by position return a Vector.
+
+    see: https://docs.python.org/3/library/bisect.html
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _build_storage(cls, items: Iterable[Any], /) -> _Storage:
+        return _Trie.from_iterable(sorted(items))
+
+    @classmethod
+    def _coerce(cls, items: Iterable[Any], /) -> Vector[Any]:
+        return Vector(items)
+
+    @classmethod
+    def concat_all(cls, vectors: Iterable[Iterable[T]], /) -> Vector[T]:
+        return cls(chain.from_iterable(vectors))
+
+    @overload
+    def __getitem__(self, index: int, /) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice, /) -> Vector[T]:
+        ...
+
+    def __getitem__(self, index: int | slice, /) -> T | Vector[T]:
+        selected = super().__getitem__(index)
+        if isinstance(index, slice) and index.step is not None and index.step < 0:
+            return Vector._from_storage(cast("Vector[T]", selected)._storage)
+        return selected
+
+    def __contains__(self, obj: object, /) -> bool:
+        try:
+            position = bisect_left(self, obj)
+        except TypeError:
+            return super().__contains__(obj)
+        return position < len(self) and self._storage.get(position) == obj
+
+    def __add__(self, other: Vector[T] | list[T], /) -> Vector[T]:
+        if not isinstance(other, (Vector, list)):
+            return NotImplemented
+        return Vector._from_storage(self._storage).__add__(other)
+
+    def __mul__(self, times: int, /) -> Vector[T]:
+        return Vector(tuple(self) * times)
+
+    __rmul__ = __mul__
+
+    def append(self, obj: T, /) -> Vector[T]:
+        return Vector._from_storage(self._storage.append(obj))
+
+    def extend(self, items: Iterable[T], /) -> Vector[T]:
+        return Vector._from_storage(self._storage).extend(items)
+
+    def updated(self, index: int, obj: T, /) -> Vector[T]:
+        return Vector._from_storage(self._storage).updated(index, obj)
+
+    def insert(self, *, index: int, obj: T) -> Vector[T]:
+        return Vector._from_storage(self._storage).insert(index=index, obj=obj)
+
+    def add(self, obj: T, /) -> SortedVector[T]:
+        """Insert in order, after the elements equal to obj."""
+        position = bisect_right(self, obj)
+        if position == len(self):
+            return cast("SortedVector[T]", self._from_storage(self._storage.append(obj)))
+        items = chain(islice(self, position), (obj,), islice(self, position, None))
+        return cast("SortedVector[T]", self._from_storage(_Trie.from_iterable(items)))
+
+    def index(self, *, obj: T, start: int = 0, end: int = sys.maxsize) -> int:  # type: ignore
+        start, end, _ = slice(start, end).indices(len(self))
+        position = bisect_left(self, obj, start, max(start, end))
+        if position < end and self._storage.get(position) == obj:
+            return position
+        raise ValueError(f"{obj!r} is not in {self.__class__.__name__}")
+
+    def count(self, obj: T, /) -> int:
+        return bisect_right(self, obj) - bisect_left(self, obj)
+
+    def search(self, obj: T, /) -> option.Option[int]:
+        """Position of obj, found by binary search."""
+        try:
+            return option.Some(self.index(obj=obj))
+        except ValueError:
+            return option.VOID
+
+    def range(self, lower: T, upper: T, /) -> SortedVector[T]:
+        """Elements from lower inclusive to upper exclusive, sharing the trie."""
+        start = bisect_left(self, lower)
+        return cast("SortedVector[T]", self[start : max(start, bisect_left(self, upper))])
+
+    def merge(self, other: Iterable[T], /) -> SortedVector[T]:
+        """Merge in O(n + m) when other is a SortedVector, joining without copying
+        when one of them sorts entirely after the other."""
+        if not isinstance(other, SortedVector):
+            other = SortedVector(other)
+        if self.is_empty():
+            return other
+        if other.is_empty():
+            return self
+        if not other[0] < self[-1]:
+            return cast("SortedVector[T]", self._from_storage(self._storage.concat(other._storage)))
+        if other[-1] < self[0]:
+            return cast("SortedVector[T]", self._from_storage(other._storage.concat(self._storage)))
+        return cast(
+            "SortedVector[T]", self._from_storage(_Trie.from_iterable(heapq.merge(self, other)))
+        )
+
+    def sort(
+        self,
+        *,
+        key: Optional[Callable[[T], Any]] = None,
+        reverse: bool = False,
+    ) -> Vector[T]:
+        if key is None and not reverse:
+            return self
+        return Vector(sorted(self, key=key, reverse=reverse))  # type: ignore
+
+    def filter(self, function: Callable[[T], bool], /) -> Vector[T]:
+        return self._from_storage(_Trie.from_iterable(filter(function, self)))
+
+
+class _TreeNode:
+    """Node of a persistent AVL tree"""
+
+    __slots__ = ("key", "value", "left", "right", "height", "size")
+
+    def __init__(self, key: Any, value: Any, left: Optional[_TreeNode], right: Optional[_TreeNode]):
+        self.key = key
+        self.value = value
+        self.left = left
+        self.right = right
+        self.height = 1 + max(_tree_height(left), _tree_height(right))
+        self.size = 1 + _tree_size(left) + _tree_size(right)
+
+
+def _tree_height(node: Optional[_TreeNode], /) -> int:
+    return 0 if node is None else node.height
+
+
+def _tree_size(node: Optional[_TreeNode], /) -> int:
+    return 0 if node is None else node.size
+
+
+def _tree_balance(
+    key: Any, value: Any, left: Optional[_TreeNode], right: Optional[_TreeNode], /
+) -> _TreeNode:
+    """Rotate when the heights of the subtrees differ by two."""
+    if _tree_height(right) + 1 < _tree_height(left):
+        left = cast(_TreeNode, left)
+        if _tree_height(left.right) <= _tree_height(left.left):
+            return _TreeNode(
+                left.key, left.value, left.left, _TreeNode(key, value, left.right, right)
+            )
+        inner = cast(_TreeNode, left.right)
+        return _TreeNode(
+            inner.key,
+            inner.value,
+            _TreeNode(left.key, left.value, left.left, inner.left),
+            _TreeNode(key, value, inner.right, right),
+        )
+    if _tree_height(left) + 1 < _tree_height(right):
+        right = cast(_TreeNode, right)
+        if _tree_height(right.left) <= _tree_height(right.right):
+            return _TreeNode(
+                right.key, right.value, _TreeNode(key, value, left, right.left), right.right
+            )
+        inner = cast(_TreeNode, right.left)
+        return _TreeNode(
+            inner.key,
+            inner.value,
+            _TreeNode(key, value, left, inner.left),
+            _TreeNode(right.key, right.value, inner.right, right.right),
+        )
+    return _TreeNode(key, value, left, right)
+
+
+def _tree_join(
+    left: Optional[_TreeNode], key: Any, value: Any, right: Optional[_TreeNode], /
+) -> _TreeNode:
+    """Join trees of any height around a key that sorts between them."""
+    if _tree_height(right) + 1 < _tree_height(left):
+        left = cast(_TreeNode, left)
+        return _tree_balance(
+            left.key, left.value, left.left, _tree_join(left.right, key, value, right)
+        )
+    if _tree_height(left) + 1 < _tree_height(right):
+        right = cast(_TreeNode, right)
+        return _tree_balance(
+            right.key, right.value, _tree_join(left, key, value, right.left), right.right
+        )
+    return _TreeNode(key, value, left, right)
+
+
+def _tree_split(
+    node: Optional[_TreeNode], key: Any, /
+) -> tuple[Optional[_TreeNode], Optional[_TreeNode], Optional[_TreeNode]]:
+    """Trees below and above key, with the node at key if there is one."""
+    if node is None:
+        return None, None, None
+    if key < node.key:
+        left, found, right = _tree_split(node.left, key)
+        return left, found, _tree_join(right, node.key, node.value, node.right)
+    if node.key < key:
+        left, found, right = _tree_split(node.right, key)
+        return _tree_join(node.left, node.key, node.value, left), found, right
+    return node.left, node, node.right
+
+
+def _tree_updated(node: Optional[_TreeNode], key: Any, value: Any, /) -> _TreeNode:
+    if node is None:
+        return _TreeNode(key, value, None, None)
+    if key < node.key:
+        left = _tree_updated(node.left, key, value)
+        return _tree_balance(node.key, node.value, left, node.right)
+    if node.key < key:
+        right = _tree_updated(node.right, key, value)
+        return _tree_balance(node.key, node.value, node.left, right)
+    return _TreeNode(key, value, node.left, node.right)
+
+
+def _tree_pop_first(node: _TreeNode, /) -> tuple[Any, Any, Optional[_TreeNode]]:
+    if node.left is None:
+        return node.key, node.value, node.right
+    key, value, left = _tree_pop_first(node.left)
+    return key, value, _tree_balance(node.key, node.value, left, node.right)
+
+
+def _tree_nodes(node: Optional[_TreeNode], /) -> Iterator[_TreeNode]:
+    """In order, without recursion."""
+    stack: list[_TreeNode] = []
+    while stack or node is not None:
+        if node is not None:
+            stack.append(node)
+            node = node.left
+        else:
+            node = stack.pop()
+            yield node
+            node = node.right
+
+
+def _tree_from_sorted(pairs: Sequence[tuple[Any, Any]], /) -> Optional[_TreeNode]:
+    def build(start: int, stop: int) -> Optional[_TreeNode]:
+        if start == stop:
+            return None
+        middle = (start + stop) // 2
+        key, value = pairs[middle]
+        return _TreeNode(key, value, build(start, middle), build(middle + 1, stop))
+
+    return build(0, len(pairs))
+
+
+class TreeMap(Mapping[K, V]):
+    """Immutable Mapping ordered by key
+
+    Backed by a persistent AVL tree: lookups, updated, removed and range take O(log n)
+    and share every untouched subtree with the previous version.
+    Keys only need to be comparable, not hashable.
+
+    see: https://www.scala-lang.org/api/current/scala/collection/immutable/TreeMap.html
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, items: Optional[Mapping[K, V] | Iterable[tuple[K, V]]] = None):
+        if items is None:
+            items = ()
+        elif isinstance(items, Mapping):
+            items = items.items()
+        pairs = sorted(items, key=itemgetter(0))
+        unique = [
+            pair for pair, following in zip(pairs, pairs[1:]) if pair[0] < following[0]
+        ] + pairs[-1:]
+        self._root: Optional[_TreeNode] = _tree_from_sorted(unique)
+
+    @classmethod
+    def _from_root(cls, root: Optional[_TreeNode], /) -> TreeMap[K, V]:
+        instance = cls.__new__(cls)
+        instance._root = root
+        return instance
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
+
+    def __reduce__(self) -> tuple[Type[TreeMap[K, V]], tuple[tuple[tuple[K, V], ...]]]:
+        return (self.__class__, (tuple(self.items()),))
+
+    def __len__(self) -> int:
+        return _tree_size(self._root)
+
+    def __iter__(self) -> Iterator[K]:
+        return (node.key for node in _tree_nodes(self._root))
+
+    def __getitem__(self, key: K, /) -> V:
+        node = self._root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return node.value
+        raise KeyError(key)
+
+    def items(self) -> ItemsView[K, V]:
+        return _TreeItemsView(self)
+
+    def updated(self, key: K, value: V, /) -> TreeMap[K, V]:
+        return self._from_root(_tree_updated(self._root, key, value))
+
+    def removed(self, key: K, /) -> TreeMap[K, V]:
+        left, found, right = _tree_split(self._root, key)
+        if found is None:
+            return self
+        if right is None:
+            return self._from_root(left)
+        first_key, first_value, rest = _tree_pop_first(right)
+        return self._from_root(_tree_join(left, first_key, first_value, rest))
+
+    def range(self, lower: K, upper: K, /) -> TreeMap[K, V]:
+        """Entries from lower inclusive to upper exclusive."""
+        _, found, above = _tree_split(self._root, lower)
+        if found is not None:
+            above = _tree_join(None, found.key, found.value, above)
+        below, _, _ = _tree_split(above, upper)
+        return self._from_root(below)
+
+    def floor(self, key: K, /) -> option.Option[tuple[K, V]]:
+        """Entry with the greatest key less than or equal to key."""
+        node, candidate = self._root, None
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            else:
+                node, candidate = node.right, node
+        if candidate is None:
+            return option.VOID
+        return option.Some((candidate.key, candidate.value))
+
+    def ceiling(self, key: K, /) -> option.Option[tuple[K, V]]:
+        """Entry with the least key greater than or equal to key."""
+        node, candidate = self._root, None
+        while node is not None:
+            if node.key < key:
+                node = node.right
+            else:
+                node, candidate = node.left, node
+        if candidate is None:
+            return option.VOID
+        return option.Some((candidate.key, candidate.value))
+
+
+class _TreeItemsView(ItemsView[K, V]):
+    """Entries in key order, without a lookup per key"""
+
+    _mapping: TreeMap[K, V]
+
+    def __iter__(self) -> Iterator[tuple[K, V]]:
+        return ((node.key, node.value) for node in _tree_nodes(self._mapping._root))
+
+
+class NumericVector(Vector[N]):
+    """Immutable Collection of unboxed numbers
+
+    Backed by the stdlib array module and exposed through a read-only memoryview.
+    Operations whose results no longer fit the element type return a Vector.
+
+    When NumPy is importable, aggregates run on the buffer, and map, filter and reduce
+    dispatch to NumPy for ufuncs or when called with vectorized=True.
+    Without NumPy the same calls fall back to applying the function per element.
+    """
+
+    __slots__ = ()
+
+    TYPECODE: ClassVar[str]
+    ELEMENT_TYPE: ClassVar[Type[Any]]
+
+    @classmethod
+    def _build_storage(cls, items: Iterable[Any], /) -> _Storage:
+        return _Array.from_iterable(cls.TYPECODE, items)
+
+    @classmethod
+    def concat_all(cls, vectors: Iterable[Iterable[N]], /) -> Vector[N]:
+        return cls(chain.from_iterable(vectors))
+
+    @classmethod
+    def _coerce(cls, items: Iterable[Any], /) -> Vector[Any]:
+        elements = tuple(items)
+        if set(map(type, elements)) <= {cls.ELEMENT_TYPE}:
+            try:
+                return cls(elements)
+            except OverflowError:
+                pass
+        return Vector(elements)
+
+    def _widened(self, operation: Callable[[Vector[Any]], Vector[Any]], /) -> Vector[Any]:
+        """Apply operation, on a Vector when its result does not fit the array."""
+        try:
+            return operation(self)
+        except (TypeError, OverflowError):
+            return operation(Vector(self))
+
+    def __add__(self, other: Vector[Any] | list[Any], /) -> Vector[Any]:
+        return self._widened(lambda vector: Vector.__add__(vector, other))
+
+    def append(self, obj: Any, /) -> Vector[Any]:
+        return self._widened(lambda vector: Vector.append(vector, obj))
+
+    def extend(self, items: Iterable[Any], /) -> Vector[Any]:
+        elements = items if isinstance(items, Sequence) else tuple(items)
+        return self._widened(lambda vector: Vector.extend(vector, elements))
+
+    def updated(self, index: int, obj: Any, /) -> Vector[Any]:
+        return self._widened(lambda vector: Vector.updated(vector, index, obj))
+
+    def insert(self, *, index: int, obj: Any) -> Vector[Any]:
+        return self._widened(lambda vector: Vector.insert(vector, index=index, obj=obj))
+
+    @property
+    def _data(self) -> memoryview:
+        return cast(_Array, self._storage).data
+
+    def __reduce__(self) -> tuple[Type[Vector[N]], tuple[array[Any]]]:  # type: ignore
+        return (self.__class__, (cast(_Array, self._storage).copied(),))
+
+    def to_memoryview(self) -> memoryview:
+        return self._data
+
+    def _ndarray(self) -> Any:
+        return numpy.asarray(self._data)  # type: ignore
+
+    @staticmethod
+    def _vectorize(function_: Callable[..., Any], vectorized: bool, /) -> bool:
+        return numpy is not None and (vectorized or isinstance(function_, numpy.ufunc))
+
+    @staticmethod
+    def _from_ndarray(ndarray: Any, /) -> Vector[Any]:
+        match ndarray.dtype.kind, ndarray.dtype.itemsize:
+            case ("i", _) | ("u", 1 | 2 | 4):
+                factory, dtype = IntVector, numpy.int64  # type: ignore
+            case ("f", _):
+                factory, dtype = FloatVector, numpy.float64  # type: ignore
+            case _:
+                return Vector(ndarray.tolist())
+        return factory._from_storage(_Array.from_ndarray(factory.TYPECODE, ndarray.astype(dtype)))
+
+    def map(  # type: ignore
+        self, function_: Callable[[N], A], /, *, vectorized: bool = False
+    ) -> Vector[A]:
+        if not self._vectorize(function_, vectorized):
+            return super().map(function_)
+        return self._from_ndarray(numpy.asarray(function_(self._ndarray())))  # type: ignore
+
+    def filter(  # type: ignore
+        self, function: Callable[[N], bool], /, *, vectorized: bool = False
+    ) -> Vector[N]:
+        if not self._vectorize(function, vectorized):
+            return super().filter(function)
+        ndarray = self._ndarray()
+        mask = numpy.asarray(function(ndarray), dtype=bool)  # type: ignore
+        return self._from_storage(_Array.from_ndarray(self.TYPECODE, ndarray[mask]))
+
+    def reduce(self, function: Callable[[N, N], N], /) -> N:
+        if not self._vectorize(function, False):
+            return super().reduce(function)
+        if self.is_empty():
+            raise TypeError("reduce() of empty sequence with no initial value")
+        return function.reduce(self._ndarray()).item()  # type: ignore
+
+    def sum(self) -> N:
+        if numpy is None:
+            return sum(self._data)
+        return self._ndarray().sum().item()
+
+    def min(self) -> N:
+        if numpy is None or self.is_empty():
+            return min(self._data)
+        return self._ndarray().min().item()
+
+    def max(self) -> N:
+        if numpy is None or self.is_empty():
+            return max(self._data)
+        return self._ndarray().max().item()
+
+    def mean(self) -> float:
+        if numpy is None or self.is_empty():
+            return fmean(self._data)
+        return self._ndarray().mean().item()
+
+
+class IntVector(NumericVector[int]):
+    """Immutable Collection of signed 64-bit integers"""
+
+    __slots__ = ()
+
+    TYPECODE = "q"
+    ELEMENT_TYPE = int
+
+    def sum(self) -> int:
+        """Exact sum, on the buffer only when it cannot overflow 64 bits."""
+        if numpy is None or self.is_empty():
+            return sum(self._data)
+        ndarray = self._ndarray()
+        if len(self) * max(-ndarray.min().item(), ndarray.max().item()) < 2**63:
+            return ndarray.sum().item()
+        return sum(self._data)
+
+
+class FloatVector(NumericVector[float]):
+    """Immutable Collection of double precision floats"""
+
+    __slots__ = ()
+
+    TYPECODE = "d"
+    ELEMENT_TYPE = float
@@ -8,10 +8,12 @@ from typing import (
     Callable,
     Generic,
     Literal,
+    Optional,
     ParamSpec,
     TypeAlias,
     TypeVar,
     cast,
+    overload,
 )
 
 from . import constraints, extension, extractor, monad, option, try_
@@ -28,6 +30,8 @@ P = ParamSpec("P")
 class Either(ABC, Generic[Lp, Rp], monad.Monad[Rp], extension.Extension):
     """Either"""
 
+    __slots__ = ()
+
     @abstractmethod
     def __iter__(self) -> Generator[Either[Lp, Rp], None, Rp]:
         raise NotImplementedError()
@@ -38,7 +42,7 @@ class Either(ABC, Generic[Lp, Rp], monad.Monad[Rp], extension.Extension):
 
     @staticmethod
     def pure(value: R) -> Either[Lp, R]:
-        return Right[Lp, R](value)
+        return Right(value)
 
     @abstractmethod
     def flat_map(self, func: Callable[[Rp], Either[Lp, RRp]], /) -> Either[Lp, RRp]:  # type: ignore
@@ -89,21 +93,56 @@ class Either(ABC, Generic[Lp, Rp], monad.Monad[Rp], extension.Extension):
     def pattern(self) -> SubType[Lp, Rp]:
         raise NotImplementedError()
 
+    def lazy(self) -> Either[Lp, Rp]:
+        """Evaluate map and flat_map on demand, in constant stack."""
+        return LazyEither(self)
+
+    @overload
     @staticmethod
-    def do(  # type: ignore
+    def do(
         context: Callable[P, Generator[Either[Lp, Any], None, Rp]], /
     ) -> Callable[P, Either[Lp, Rp]]:
         """map, flat_map combination syntax sugar."""
-        return cast(Callable[P, Either[Lp, Rp]], monad.Monad.do(context))
+
+    @overload
+    @staticmethod
+    def do(
+        *, compile: bool = False, unchecked: bool = False
+    ) -> Callable[[Callable[P, Generator[Either[Lp, Any], None, Rp]]], Callable[P, Either[Lp, Rp]]]:
+        """map, flat_map combination syntax sugar.
+
+        compile=True rewrites the context into plain code once.
+        unchecked=True skips the runtime type checks of the yielded monads.
+        """
+
+    @staticmethod
+    def do(  # type: ignore
+        context: Optional[Callable[P, Generator[Either[Lp, Any], None, Rp]]] = None,
+        /,
+        *,
+        compile: bool = False,
+        unchecked: bool = False,
+    ) -> (
+        Callable[P, Either[Lp, Rp]]
+        | Callable[[Callable[P, Generator[Either[Lp, Any], None, Rp]]], Callable[P, Either[Lp, Rp]]]
+    ):
+        """map, flat_map combination syntax sugar."""
+        return monad.Monad.do(context, compile=compile, unchecked=unchecked)  # type: ignore
 
 
-class Left(Either[Lp, Rp], extractor.Extractor):
+class Left(Either[Lp, Rp], extractor.Immutable):
     """Left"""
 
+    __slots__ = ("value",)
+
     __match_args__ = ("value",)
 
-    def __init__(self, value: Lp, /):
-        self.value = value
+    value: Lp
+
+    short_circuit = True
+
+    def __new__(cls, value: Lp, /) -> Left[Lp, Rp]:
+        return cls._create(value)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.value})"
@@ -116,29 +155,29 @@ class Left(Either[Lp, Rp], extractor.Extractor):
                 return False
 
     def __iter__(self) -> Generator[Either[Lp, Rp], None, Rp]:
-        raise GeneratorExit(self)
+        return iter((self,))  # type: ignore # Yielded once to short circuit
 
     def map(self, _: Callable[[Rp], RRp], /) -> Either[Lp, RRp]:
-        return cast(Left[Lp, RRp], self)
+        return cast("Left[Lp, RRp]", self)
 
     def flat_map(self, _: Callable[[Rp], Either[Lp, RRp]], /) -> Either[Lp, RRp]:
-        return cast(Left[Lp, RRp], self)
+        return cast("Left[Lp, RRp]", self)
 
     @property
     def to_option(self) -> option.Option[Rp]:
         return option.VOID
 
     def to_try(self, evidence: constraints.SubtypeConstraints[Lp, Exception], /) -> try_.Try[Rp]:
-        return try_.Failure[Rp](cast(Exception, self.value))
+        return try_.Failure(cast(Exception, self.value))
 
     def fold(self, *, left: Callable[[Lp], U], right: Callable[[Rp], U]) -> U:
         return left(self.value)
 
     def left(self) -> LeftProjection[Lp, Rp]:
-        return LeftProjection[Lp, Rp](either=self)
+        return LeftProjection(either=self)
 
     def right(self) -> RightProjection[Lp, Rp]:
-        return RightProjection[Lp, Rp](either=self)
+        return RightProjection(either=self)
 
     def is_left(self) -> Literal[True]:
         return True
@@ -157,13 +196,17 @@ class Left(Either[Lp, Rp], extractor.Extractor):
         return self
 
 
-class Right(Either[Lp, Rp], extractor.Extractor):
+class Right(Either[Lp, Rp], extractor.Immutable):
     """Right"""
 
+    __slots__ = ("value",)
+
     __match_args__ = ("value",)
 
-    def __init__(self, value: Rp, /):
-        self.value = value
+    value: Rp
+
+    def __new__(cls, value: Rp, /) -> Right[Lp, Rp]:
+        return cls._create(value)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.value})"
@@ -180,26 +223,26 @@ class Right(Either[Lp, Rp], extractor.Extractor):
         return self.value
 
     def map(self, func: Callable[[Rp], RRp], /) -> Either[Lp, RRp]:
-        return Right[Lp, RRp](func(self.value))
+        return Right(func(self.value))
 
     def flat_map(self, func: Callable[[Rp], Either[Lp, RRp]], /) -> Either[Lp, RRp]:
         return func(self.value)
 
     @property
     def to_option(self) -> option.Option[Rp]:
-        return option.Some[Rp](self.value)
+        return option.Some(self.value)
 
     def to_try(self, evidence: constraints.SubtypeConstraints[Lp, Exception], /) -> try_.Try[Rp]:
-        return try_.Success[Rp](self.value)
+        return try_.Success(self.value)
 
     def fold(self, *, left: Callable[[Lp], U], right: Callable[[Rp], U]) -> U:
         return right(self.value)
 
     def left(self) -> LeftProjection[Lp, Rp]:
-        return LeftProjection[Lp, Rp](either=self)
+        return LeftProjection(either=self)
 
     def right(self) -> RightProjection[Lp, Rp]:
-        return RightProjection[Lp, Rp](either=self)
+        return RightProjection(either=self)
 
     def is_left(self) -> Literal[False]:
         return False
@@ -218,6 +261,32 @@ class Right(Either[Lp, Rp], extractor.Extractor):
         return self
 
 
+class LazyEither(monad.Lazy[Rp], Either[Lp, Rp]):
+    """Either evaluated on demand"""
+
+    def evaluate(self) -> Either[Lp, Rp]:
+        return cast("Either[Lp, Rp]", super().evaluate())
+
+    @property
+    def to_option(self) -> option.Option[Rp]:
+        return self.evaluate().to_option
+
+    def to_try(self, evidence: constraints.SubtypeConstraints[Lp, Exception], /) -> try_.Try[Rp]:
+        return self.evaluate().to_try(evidence)
+
+    def left(self) -> LeftProjection[Lp, Rp]:
+        return self.evaluate().left()
+
+    def right(self) -> RightProjection[Lp, Rp]:
+        return self.evaluate().right()
+
+    def is_left(self) -> bool:
+        return self.evaluate().is_left()
+
+    def is_right(self) -> bool:
+        return self.evaluate().is_right()
+
+
 class LeftProjection(Generic[Lp, Rp], extension.Extension):
     """LeftProjection"""
 
@@ -246,16 +315,16 @@ class LeftProjection(Generic[Lp, Rp], extension.Extension):
     def map(self, func: Callable[[Lp], LLp], /) -> Either[LLp, Rp]:
         match self._either:
             case Left() as left:
-                return Left[LLp, Rp](func(left.value))
+                return Left(func(left.value))
             case Right() as right:
-                return cast(Right[LLp, Rp], right)
+                return cast("Right[LLp, Rp]", right)
 
     def flat_map(self, func: Callable[[Lp], Either[LLp, Rp]], /) -> Either[LLp, Rp]:
         match self._either:
             case Left() as left:
                 return func(left.value)
             case Right() as right:
-                return cast(Right[LLp, Rp], right)
+                return cast("Right[LLp, Rp]", right)
 
 
 class RightProjection(Generic[Lp, Rp], extension.Extension):
@@ -286,14 +355,14 @@ class RightProjection(Generic[Lp, Rp], extension.Extension):
     def map(self, func: Callable[[Rp], RRp], /) -> Either[Lp, RRp]:
         match self._either:
             case Left() as left:
-                return cast(Left[Lp, RRp], left)
+                return cast("Left[Lp, RRp]", left)
             case Right() as right:
-                return Right[Lp, RRp](func(right.get()))
+                return Right(func(right.get()))
 
     def flat_map(self, func: Callable[[Rp], Either[Lp, RRp]], /) -> Either[Lp, RRp]:
         match self._either:
             case Left() as left:
-                return cast(Left[Lp, RRp], left)
+                return cast("Left[Lp, RRp]", left)
             case Right() as right:
                 return func(right.get())
 
@@ -6,5 +6,7 @@ Bp = TypeVar("Bp", covariant=True)
 
 
 class Extension:
+    __slots__ = ()
+
     def method(self: A, function_: Callable[[A], Bp], /) -> Bp:
         return function_(self)
@@ -1,13 +1,15 @@
 """Extractor"""
-from typing import Any
+from typing import Any, NoReturn
 
 
 class Extractor:
+    __slots__ = ()
+
     __match_args__: tuple[()] | tuple[str, ...] = ()
 
     @classmethod
     def apply(cls, *args: ..., **kwargs: ...):
-        instance = cls.__new__(cls)
+        instance = cls.__new__(cls, *args, **kwargs)
         instance.__init__(*args, **kwargs)
         return instance
 
@@ -16,4 +18,39 @@ class Extractor:
         if len(self.__match_args__) <= 0:
             return ()
         else:
-            return tuple(value for key, value in vars(self).items() if key in self.__match_args__)
+            return tuple(getattr(self, key) for key in self.__match_args__)
+
+
+_INTERNED: dict[tuple[type, Any], Any] = {}
+
+
+class Immutable(Extractor):
+    """Extractor without __dict__ whose match attributes are set once, in __new__.
+
+    Subclasses declare the match attributes as __slots__ and build instances in
+    __new__ through _create. Pickle and copy rebuild the instance from unapply.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _create(cls, value: Any, /) -> Any:
+        """Instance holding value in its single match attribute.
+
+        Instances holding None, True or False are created once per class and shared.
+        """
+        interning = value is None or value is True or value is False
+        if interning and (interned := _INTERNED.get((cls, value))) is not None:
+            return interned
+        instance = object.__new__(cls)
+        object.__setattr__(instance, cls.__match_args__[0], value)
+        return _INTERNED.setdefault((cls, value), instance) if interning else instance
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self) -> tuple[type, tuple[Any, ...]]:
+        return self.__class__, self.unapply()
@@ -3,8 +3,7 @@ from __future__ import annotations
 
 import inspect
 from collections.abc import Callable
-from copy import deepcopy
-from functools import wraps
+from importlib import import_module
 from typing import Any, Generic, Optional, ParamSpec, TypeVar, cast, overload
 
 from . import processor
@@ -36,13 +35,15 @@ Tp = TypeVar("Tp", covariant=True)
 Tdp = TypeVar("Tdp", covariant=True)
 P = ParamSpec("P")
 
-LAST_ONE = 1
 # Limit number of Type variables that can be parsed by the signature.
 LIMIT_NUMBER_OF_TYPE_VARIABLES = 22
 
 
 class Function:
-    ...
+    _func: Callable[..., Any]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (_picklable(self._func),)
 
 
 class Function1(Generic[S1m, Tp], Function):
@@ -57,10 +58,42 @@ class Function1(Generic[S1m, Tp], Function):
     apply = __call__
 
     def compose(self, other: Callable[[Tdp], S1m] | Function1[Tdp, S1m]) -> Function1[Tdp, Tp]:
-        return Function1[Tdp, Tp](lambda arg: self(other(arg)))  # type: ignore # Type checker error
+        return Composition(*_stages(other), *_stages(self))
 
     def and_then(self, other: Callable[[Tp], Tdp] | Function1[Tp, Tdp]) -> Function1[S1m, Tdp]:
-        return Function1[S1m, Tdp](lambda arg: other(self(arg)))
+        return Composition(*_stages(self), *_stages(other))
+
+
+class Composition(Function1[Any, Any]):
+    """Function1 applying its functions in order
+
+    Composing a Composition extends the flat tuple of functions instead of
+    nesting, so a call runs one loop whatever the number of stages.
+    """
+
+    def __init__(self, *functions: Callable[[Any], Any]):
+        self._functions = functions
+
+    def __call__(self, arg: Any, /) -> Any:
+        for function in self._functions:
+            arg = function(arg)
+        return arg
+
+    apply = __call__
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return Composition, tuple(_picklable(function) for function in self._functions)
+
+
+def _stages(function: Callable[[Any], Any], /) -> tuple[Callable[[Any], Any], ...]:
+    """Functions a composition with function runs, unwrapping plain Function1."""
+    match function:
+        case Composition():
+            return function._functions
+        case Function1() if type(function) is Function1:
+            return (function._func,)
+        case _:
+            return (function,)
 
 
 class FunctionN(Function):
@@ -3205,15 +3238,6 @@ def curry(
     ...
 
 
-def _total_application(function: Callable[..., Tp], arguments: dict[str, Any]) -> Tp:
-    defaults_applied_arguments = processor.apply_defaults(arguments=arguments, function=function)
-    partial_range = partial_application_scope(
-        arguments=defaults_applied_arguments, function=function
-    )
-    position_parameter = tuple(arguments.values())[:partial_range]
-    return function(*position_parameter, **{})
-
-
 def partial_application_scope(
     *, arguments: processor.Arguments, function: Callable[..., Any]
 ) -> int:
@@ -3231,10 +3255,6 @@ def partial_application_scope(
     return len(arguments) - (defaults_size + kwdefaults_size)
 
 
-def next_partial_position(position: int, /) -> int:
-    return position + 1
-
-
 def curry(func: Callable[P, Tp], /):  # type: ignore # Type inference
     """currying
 
@@ -3242,53 +3262,75 @@ def curry(func: Callable[P, Tp], /):  # type: ignore # Type inference
     - No support for keyword-only arguments.
     - Default arguments are not subject to currying.
     """
-    initial_arguments = deepcopy(inspect.signature(func).parameters.copy())
-    if partial_application_scope(arguments=initial_arguments, function=func) < 2:
+    arity = partial_application_scope(
+        arguments=dict(inspect.signature(func).parameters), function=func
+    )
+    if arity < 2:
         raise TypeError(
             "Signatures that cannot be broken down into partial applications.",
             func,
-            initial_arguments,
         )
-    if LIMIT_NUMBER_OF_TYPE_VARIABLES < partial_application_scope(
-        arguments=initial_arguments, function=func
-    ):
+    if LIMIT_NUMBER_OF_TYPE_VARIABLES < arity:
         raise TypeError(
             """
             The number of Type variables
             that can be parsed by the signature has exceeded the limit.
             """,
             func,
-            initial_arguments,
         )
+    return Curried(func, arity, ())  # type: ignore # Type inference
 
-    @wraps(func)
-    def closure(  # type: ignore # Type inference
-        *,
-        function: Callable[P, Tp],
-        arguments: processor.Arguments,
-        position: int,
-    ):
-        def partial_application(value: Optional[Any] = None, /):  # type: ignore # Type inference
-            key = list(arguments)[position]
-            partial_applied_arguments = deepcopy(arguments)
-            partial_applied_arguments[key] = value
-            if (
-                position
-                < partial_application_scope(arguments=partial_applied_arguments, function=function)
-                - LAST_ONE
-            ):
-                return closure(  # type: ignore # Type inference
-                    function=function,
-                    arguments=partial_applied_arguments,
-                    position=next_partial_position(position),
-                )
-            else:
-                return _total_application(function=function, arguments=partial_applied_arguments)
-
-        return Function1(partial_application)  # type: ignore # Type inference
-
-    return closure(  # type: ignore # Type inference
-        function=func,
-        arguments=initial_arguments,
-        position=0,
-    )
+
+class Curried(Function1[Any, Any]):
+    """Partial application of a curried function
+
+    Holds the function, its arity and the arguments applied so far. Each call
+    returns the next Curried, or the result once arity arguments are applied.
+    """
+
+    def __init__(self, func: Callable[..., Any], arity: int, arguments: tuple[Any, ...], /):
+        self._func = func
+        self._arity = arity
+        self._arguments = arguments
+
+    def __call__(self, arg: Any, /) -> Any:
+        arguments = self._arguments + (arg,)
+        if len(arguments) < self._arity:
+            return Curried(self._func, self._arity, arguments)
+        return self._func(*arguments)
+
+    apply = __call__
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return Curried, (_picklable(self._func), self._arity, self._arguments)
+
+
+class _Reference:
+    """Pickled as the module and qualified name of a function, which refer to a
+    Function decorating it rather than to the function itself."""
+
+    def __init__(self, func: Callable[..., Any], /):
+        self.func = func
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _unwrapped, (self.func.__module__, self.func.__qualname__)
+
+
+def _unwrapped(module: str, qualname: str, /) -> Any:
+    """Object of the qualified name in the module, without its Function wrappers."""
+    found: Any = import_module(module)
+    for name in qualname.split("."):
+        found = getattr(found, name)
+    while isinstance(found, Function) and hasattr(found, "_func"):
+        found = found._func
+    return found
+
+
+def _picklable(func: Callable[..., Any], /) -> Any:
+    """func, or its _Reference when its top level name refers to a Function."""
+    try:
+        if _unwrapped(func.__module__, func.__qualname__) is func:
+            return _Reference(func)
+    except (AttributeError, ImportError, TypeError):
+        ...
+    return func
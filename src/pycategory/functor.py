@@ -16,6 +16,8 @@ class Functor(Generic[Ap]):
         fmap :: (a -> b) -> f a -> f b
     """
 
+    __slots__ = ()
+
     def map(self, function_: Callable[[Ap], Bp], /) -> Functor[Bp]:
         raise NotImplementedError()
 
@@ -1,16 +1,23 @@
 """Monad"""
 from __future__ import annotations
 
-from functools import wraps
+import __future__
+import ast
+import inspect
+import textwrap
+from functools import update_wrapper, wraps
+from types import CellType, CodeType, FunctionType
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Generator,
     Optional,
     ParamSpec,
     Type,
     TypeVar,
     cast,
+    overload,
 )
 
 from . import applicative
@@ -34,53 +41,380 @@ class Monad(applicative.Applicative[Tp]):
         fail msg = error msg
     """
 
+    __slots__ = ()
+
+    # Yielding an instance of a short circuit type ends Monad.do with it, as Void does.
+    short_circuit: ClassVar[bool] = False
+
     def __iter__(self) -> Generator[Monad[Tp], None, Tp]:
         raise NotImplementedError()
 
     def flat_map(self, func: Callable[[Tp], Monad[TTp]], /) -> Monad[TTp]:
         raise NotImplementedError()
 
+    @overload
     @staticmethod
     def do(context: Callable[P, Generator[Monad[Any], None, Tp]], /) -> Callable[P, Monad[Tp]]:
         """map, flat_map combination syntax sugar."""
 
-        @wraps(context)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Monad[Tp]:
-            context_ = context(*args, **kwargs)
-            yield_state: Optional[Monad[Any]] = None
-            context_type: Optional[Type[Monad[Tp]]] = None
-            try:
-                while yield_state := next(context_):
-                    if not isinstance(yield_state, Monad):  # type: ignore # Runtime type check
-                        raise TypeError(yield_state)
-                    match context_type:
-                        case None:
-                            context_type = type(yield_state)
-                        case _ if type(yield_state) is not context_type:
-                            raise TypeError(
-                                yield_state,
-                                f"""
-                                A different type ${type(yield_state)} \
-                                from the context ${context_} is specified.
-                                """,
-                            )
-                        case _ if type(yield_state) is context_type:
-                            # Priority is given to the value of the subgenerator's return monad.
-                            pass
-                        case _:
-                            raise ValueError(context)
-
-            except GeneratorExit as exit:
-                return cast(Monad[Tp], exit.args[FixedMonad])
-
-            except StopIteration as return_:
-                if yield_state is None:
-                    raise TypeError(context, "No context type specification")
-                if context_type is None:
-                    raise TypeError(context, "No context type specification")
-                result: Tp = return_.value
-                return cast(Monad[Tp], yield_state.map(lambda _: result))
-
-            raise TypeError(context, "No context type specification")
-
-        return wrapper
+    @overload
+    @staticmethod
+    def do(
+        *, compile: bool = False, unchecked: bool = False
+    ) -> Callable[[Callable[P, Generator[Monad[Any], None, Tp]]], Callable[P, Monad[Tp]]]:
+        """map, flat_map combination syntax sugar.
+
+        compile=True rewrites the context once into code without a generator,
+        binding the value attribute of each yielded monad.
+        unchecked=True skips the runtime type checks of the yielded monads.
+        """
+
+    @staticmethod
+    def do(  # type: ignore
+        context: Optional[Callable[P, Generator[Monad[Any], None, Tp]]] = None,
+        /,
+        *,
+        compile: bool = False,
+        unchecked: bool = False,
+    ) -> (
+        Callable[P, Monad[Tp]]
+        | Callable[[Callable[P, Generator[Monad[Any], None, Tp]]], Callable[P, Monad[Tp]]]
+    ):
+        """map, flat_map combination syntax sugar."""
+
+        def wrap(
+            context: Callable[P, Generator[Monad[Any], None, Tp]], /
+        ) -> Callable[P, Monad[Tp]]:
+            if compile:
+                return _compile_do(context, unchecked=unchecked)
+            return _do_unchecked(context) if unchecked else _do(context)
+
+        if context is None:
+            return wrap
+        else:
+            return wrap(context)
+
+
+class Lazy(Monad[Tp]):
+    """Lazy map and flat_map chain
+
+    map and flat_map only record the function. The chain is evaluated once,
+    when the result is needed, by a loop instead of nested calls, so chains of any
+    length and recursive flat_map run in constant stack.
+    """
+
+    def __init__(
+        self,
+        source: Monad[Any],
+        function: Optional[Callable[[Any], Any]] = None,
+        /,
+        *,
+        map_: bool = False,
+    ):
+        self._source: Optional[Monad[Any]] = source
+        self._function = function
+        self._map = map_
+        self._result: Optional[Monad[Tp]] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({'...' if self._result is None else self._result})"
+
+    def __eq__(self, other: object) -> bool:
+        return self.evaluate() == other
+
+    def __iter__(self) -> Generator[Monad[Tp], None, Tp]:
+        return iter(self.evaluate())  # type: ignore
+
+    def map(self, func: Callable[[Tp], TTp], /) -> Lazy[TTp]:
+        return self.__class__(self, func, map_=True)  # type: ignore
+
+    def flat_map(self, func: Callable[[Tp], Monad[TTp]], /) -> Lazy[TTp]:
+        return self.__class__(self, func)  # type: ignore
+
+    def lazy(self) -> Lazy[Tp]:
+        return self
+
+    def evaluate(self) -> Monad[Tp]:
+        """Run the recorded chain, or return its result."""
+        if self._result is not None:
+            return self._result
+        continuations: list[tuple[bool, Callable[[Any], Any]]] = []
+        state: Any = self
+        while True:
+            if isinstance(state, Lazy):
+                if state._result is not None:
+                    state = state._result
+                    continue
+                if state._function is not None:
+                    continuations.append((state._map, state._function))
+                state = state._source
+            elif state.short_circuit or not continuations:
+                break
+            else:
+                map_, function = continuations.pop()
+                state = state.pure(function(state.value)) if map_ else function(state.value)
+        self._result = state
+        self._source = self._function = None
+        return cast("Monad[Tp]", state)
+
+    @property
+    def pattern(self) -> Any:
+        return self.evaluate().pattern  # type: ignore
+
+    def get(self) -> Tp:
+        return self.evaluate().get()  # type: ignore
+
+    def get_or_else(self, default: Callable[..., TTp], /) -> TTp | Tp:
+        return self.evaluate().get_or_else(default)  # type: ignore
+
+    def fold(self, **functions: Callable[[Any], TTp]) -> TTp:
+        return self.evaluate().fold(**functions)  # type: ignore
+
+
+def _do(context: Callable[P, Generator[Monad[Any], None, Tp]], /) -> Callable[P, Monad[Tp]]:
+    @wraps(context)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Monad[Tp]:
+        context_ = context(*args, **kwargs)
+        yield_state: Optional[Monad[Any]] = None
+        context_type: Optional[Type[Monad[Tp]]] = None
+        try:
+            while yield_state := next(context_):
+                if not isinstance(yield_state, Monad):  # type: ignore # Runtime type check
+                    raise TypeError(yield_state)
+                if yield_state.short_circuit:
+                    context_.close()
+                    return cast("Monad[Tp]", yield_state)
+                match context_type:
+                    case None:
+                        context_type = type(yield_state)
+                    case _ if type(yield_state) is not context_type:
+                        raise TypeError(
+                            yield_state,
+                            f"""
+                            A different type ${type(yield_state)} \
+                            from the context ${context_} is specified.
+                            """,
+                        )
+                    case _ if type(yield_state) is context_type:
+                        # Priority is given to the value of the subgenerator's return monad.
+                        pass
+                    case _:
+                        raise ValueError(context)
+
+        except GeneratorExit as exit:
+            # Monads raising GeneratorExit to short circuit.
+            return cast("Monad[Tp]", exit.args[FixedMonad])
+
+        except StopIteration as return_:
+            if yield_state is None:
+                raise TypeError(context, "No context type specification")
+            if context_type is None:
+                raise TypeError(context, "No context type specification")
+            result: Tp = return_.value
+            return cast("Monad[Tp]", yield_state.map(lambda _: result))
+
+        raise TypeError(context, "No context type specification")
+
+    return wrapper
+
+
+def _do_unchecked(
+    context: Callable[P, Generator[Monad[Any], None, Tp]], /
+) -> Callable[P, Monad[Tp]]:
+    @wraps(context)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Monad[Tp]:
+        context_ = context(*args, **kwargs)
+        yield_state: Optional[Monad[Any]] = None
+        try:
+            while yield_state := next(context_):
+                if yield_state.short_circuit:
+                    context_.close()
+                    return cast("Monad[Tp]", yield_state)
+        except GeneratorExit as exit:
+            return cast("Monad[Tp]", exit.args[FixedMonad])
+        except StopIteration as return_:
+            if yield_state is None:
+                raise TypeError(context, "No context type specification")
+            result: Tp = return_.value
+            return cast("Monad[Tp]", yield_state.map(lambda _: result))
+        raise TypeError(context, "No context type specification")
+
+    return wrapper
+
+
+_STATE = "_pycategory_do_state"
+_TYPE = "_pycategory_do_type"
+_ENTER = "_pycategory_do_enter"
+_CONTEXT = "_pycategory_do_context"
+
+_BIND = f"""
+{_STATE} = EXPRESSION
+if {_STATE}.__class__ is not {_TYPE}:
+    {_STATE}, {_TYPE} = {_ENTER}({_STATE}, {_TYPE})
+    if {_TYPE} is None:
+        return {_STATE}
+"""
+_RETURN = f"""
+if {_TYPE} is None:
+    raise TypeError({_CONTEXT}, "No context type specification")
+return {_TYPE}.pure(EXPRESSION)
+"""
+
+_COMPILED: dict[CodeType, CodeType] = {}
+
+
+def _compile_do(
+    context: Callable[P, Generator[Monad[Any], None, Tp]], /, *, unchecked: bool = False
+) -> Callable[P, Monad[Tp]]:
+    """Rewrite the context into a function without a generator.
+
+    Each yield from becomes a binding of the value attribute, returning early on
+    short circuit types such as Void, Left and Failure,
+    and each return becomes pure of the context type.
+    yield from is supported as a statement and as the value of an assignment.
+    The rewritten code is cached per code object and runs with the closure of the context.
+    """
+    code = getattr(context, "__code__", None)
+    if not inspect.isgeneratorfunction(context) or hasattr(context, "__wrapped__") or code is None:
+        raise TypeError(context, "compile requires an undecorated generator function")
+    if (compiled := _COMPILED.get(code)) is None:
+        compiled = _COMPILED.setdefault(code, _rewrite(context))
+    cells = dict(zip(code.co_freevars, context.__closure__ or ()))
+    enter = _enter_unchecked if unchecked else _enter
+    cells.update({_ENTER: CellType(enter), _CONTEXT: CellType(context)})
+    function = FunctionType(
+        compiled,
+        context.__globals__,
+        context.__name__,
+        context.__defaults__,
+        tuple(cells[name] for name in compiled.co_freevars),
+    )
+    function.__kwdefaults__ = context.__kwdefaults__
+    return cast("Callable[P, Monad[Tp]]", update_wrapper(function, context))
+
+
+def _enter(state: Any, context_type: Optional[type], /) -> tuple[Any, Optional[type]]:
+    """State and context type after the first yield, or None when the state ends the context."""
+    if not isinstance(state, Monad):
+        raise TypeError(state)
+    if isinstance(state, Lazy):
+        state = state.evaluate()
+    if state.short_circuit:
+        return state, None
+    if context_type is not None and type(state) is not context_type:
+        raise TypeError(state, f"A different type ${type(state)} from the context is specified.")
+    return state, type(state)
+
+
+def _enter_unchecked(state: Any, context_type: Optional[type], /) -> tuple[Any, Optional[type]]:
+    if isinstance(state, Lazy):
+        state = state.evaluate()
+    return state, None if state.short_circuit else type(state)
+
+
+def _rewrite(context: Callable[..., Any], /) -> CodeType:
+    code = context.__code__
+    try:
+        module = ast.parse(textwrap.dedent(inspect.getsource(context)))
+    except (OSError, SyntaxError) as error:
+        raise TypeError(context, "No source code to compile") from error
+    function = module.body[0]
+    if not isinstance(function, ast.FunctionDef) or function.name != code.co_name:
+        raise TypeError(context, "No source code to compile")
+    ast.increment_lineno(module, code.co_firstlineno - 1)
+
+    docstring = function.body[:1] if ast.get_docstring(function) is not None else []
+    body = function.body[len(docstring) :]
+    end = ast.Return(value=None)
+    function.body = [
+        *docstring,
+        *_template(f"{_TYPE} = None", body[0]),
+        *_rewrite_body(body),
+        *_rewrite_statement(ast.copy_location(end, function.body[-1])),
+    ]
+    function.decorator_list = []
+    for node in _own_scope(function.body):
+        if isinstance(node, (ast.Yield, ast.YieldFrom)):
+            raise TypeError(context, f"Unsupported yield at line {node.lineno}")
+
+    parameters = ", ".join((*code.co_freevars, _ENTER, _CONTEXT))
+    factory = cast(ast.FunctionDef, ast.parse(f"def factory({parameters}): ...").body[0])
+    factory.body = [function, ast.Return(value=ast.Name(id=function.name, ctx=ast.Load()))]
+    module.body = [factory]
+    ast.fix_missing_locations(module)
+    flags = code.co_flags & __future__.annotations.compiler_flag
+    compiled = compile(module, code.co_filename, "exec", flags=flags, dont_inherit=True)
+    return next(
+        constant
+        for factory_code in compiled.co_consts
+        if isinstance(factory_code, CodeType)
+        for constant in factory_code.co_consts
+        if isinstance(constant, CodeType) and constant.co_name == function.name
+    )
+
+
+def _template(
+    source: str, node: ast.AST, /, expression: Optional[ast.expr] = None
+) -> list[ast.stmt]:
+    """Statements located at node, with EXPRESSION replaced by expression."""
+    statements = ast.parse(source).body
+    for statement in statements:
+        for child in ast.walk(statement):
+            if "lineno" in child._attributes:
+                ast.copy_location(child, node)
+    return [_Placeholder(expression).visit(statement) for statement in statements]
+
+
+class _Placeholder(ast.NodeTransformer):
+    """Replace the EXPRESSION name of a template"""
+
+    def __init__(self, expression: Optional[ast.expr], /):
+        self.expression = expression
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:
+        if node.id == "EXPRESSION" and self.expression is not None:
+            return self.expression
+        return node
+
+
+def _rewrite_body(statements: list[ast.stmt], /) -> list[ast.stmt]:
+    return [rewritten for statement in statements for rewritten in _rewrite_statement(statement)]
+
+
+def _rewrite_statement(statement: ast.stmt, /) -> list[ast.stmt]:
+    match statement:
+        case ast.Assign(targets=targets, value=ast.YieldFrom(value=expression)):
+            bound = ast.Assign(targets=targets, value=_bound_value())
+            return [*_template(_BIND, statement, expression), ast.copy_location(bound, statement)]
+        case ast.AnnAssign(value=ast.YieldFrom(value=expression)) | ast.AugAssign(
+            value=ast.YieldFrom(value=expression)
+        ):
+            statement.value = _bound_value()
+            return [*_template(_BIND, statement, expression), statement]
+        case ast.Expr(value=ast.YieldFrom(value=expression)):
+            return _template(_BIND, statement, expression)
+        case ast.Return(value=expression):
+            return _template(_RETURN, statement, expression or ast.Constant(value=None))
+        case ast.FunctionDef() | ast.AsyncFunctionDef() | ast.ClassDef():
+            return [statement]
+    for field in ("body", "orelse", "finalbody"):
+        if isinstance(getattr(statement, field, None), list):
+            setattr(statement, field, _rewrite_body(getattr(statement, field)))
+    for clause in (*getattr(statement, "handlers", ()), *getattr(statement, "cases", ())):
+        clause.body = _rewrite_body(clause.body)
+    return [statement]
+
+
+def _bound_value() -> ast.expr:
+    return ast.Attribute(value=ast.Name(id=_STATE, ctx=ast.Load()), attr="value", ctx=ast.Load())
+
+
+def _own_scope(statements: list[ast.stmt], /) -> Generator[ast.AST, None, None]:
+    """Nodes of the statements, without the bodies of nested functions and classes."""
+    pending: list[ast.AST] = list(statements)
+    while pending:
+        node = pending.pop()
+        yield node
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+            continue
+        pending.extend(ast.iter_child_nodes(node))
@@ -3,7 +3,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod, abstractproperty
 from collections.abc import Generator
-from typing import Any, Callable, Literal, ParamSpec, TypeAlias, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    Literal,
+    Optional,
+    ParamSpec,
+    TypeAlias,
+    TypeVar,
+    cast,
+    overload,
+)
 
 from . import extension, extractor, monad
 
@@ -18,6 +28,8 @@ P = ParamSpec("P")
 class Option(ABC, monad.Monad[Tp], extension.Extension):
     """Option"""
 
+    __slots__ = ()
+
     @abstractmethod
     def __iter__(self) -> Generator[Option[Tp], None, Tp]:
         raise NotImplementedError()
@@ -28,7 +40,7 @@ class Option(ABC, monad.Monad[Tp], extension.Extension):
 
     @staticmethod
     def pure(value: T) -> Option[T]:
-        return Some[T](value)
+        return Some(value)
 
     @abstractmethod
     def flat_map(self, func: Callable[[Tp], Option[TTp]], /) -> Option[TTp]:  # type: ignore
@@ -58,17 +70,48 @@ class Option(ABC, monad.Monad[Tp], extension.Extension):
     def pattern(self) -> SubType[Tp]:
         raise NotImplementedError()
 
+    def lazy(self) -> Option[Tp]:
+        """Evaluate map and flat_map on demand, in constant stack."""
+        return LazyOption(self)
+
+    @overload
+    @staticmethod
+    def do(context: Callable[P, Generator[Option[Any], None, Tp]], /) -> Callable[P, Option[Tp]]:
+        """map, flat_map combination syntax sugar."""
+
+    @overload
+    @staticmethod
+    def do(
+        *, compile: bool = False, unchecked: bool = False
+    ) -> Callable[[Callable[P, Generator[Option[Any], None, Tp]]], Callable[P, Option[Tp]]]:
+        """map, flat_map combination syntax sugar.
+
+        compile=True rewrites the context into plain code once.
+        unchecked=True skips the runtime type checks of the yielded monads.
+        """
+
     @staticmethod
     def do(  # type: ignore
-        context: Callable[P, Generator[Option[Any], None, Tp]], /
-    ) -> Callable[P, Option[Tp]]:
+        context: Optional[Callable[P, Generator[Option[Any], None, Tp]]] = None,
+        /,
+        *,
+        compile: bool = False,
+        unchecked: bool = False,
+    ) -> (
+        Callable[P, Option[Tp]]
+        | Callable[[Callable[P, Generator[Option[Any], None, Tp]]], Callable[P, Option[Tp]]]
+    ):
         """map, flat_map combination syntax sugar."""
-        return cast(Callable[P, Option[Tp]], monad.Monad.do(context))
+        return monad.Monad.do(context, compile=compile, unchecked=unchecked)  # type: ignore
 
 
 class Void(Option[Tp]):
     """Void"""
 
+    __slots__ = ()
+
+    short_circuit = True
+
     def __new__(cls) -> Void[Tp]:
         if not hasattr(cls, "_singleton"):
             cls._singleton = super(Void, cls).__new__(cls)
@@ -78,13 +121,13 @@ class Void(Option[Tp]):
         return f"{self.__class__.__name__}()"
 
     def __iter__(self) -> Generator[Option[Tp], None, Tp]:
-        raise GeneratorExit(self)
+        return iter((self,))  # type: ignore # Yielded once to short circuit
 
     def map(self, _: Callable[[Tp], TTp], /) -> Option[TTp]:
-        return cast(Void[TTp], self)
+        return cast("Void[TTp]", self)
 
     def flat_map(self, _: Callable[[Tp], Option[TTp]], /) -> Option[TTp]:
-        return cast(Void[TTp], self)
+        return cast("Void[TTp]", self)
 
     def fold(self, *, void: Callable[..., U], some: Callable[[Tp], U]) -> U:
         return void()
@@ -106,13 +149,17 @@ class Void(Option[Tp]):
         return self
 
 
-class Some(Option[Tp], extractor.Extractor):
+class Some(Option[Tp], extractor.Immutable):
     """Some"""
 
+    __slots__ = ("value",)
+
     __match_args__ = ("value",)
 
-    def __init__(self, value: Tp, /):
-        self.value = value
+    value: Tp
+
+    def __new__(cls, value: Tp, /) -> Some[Tp]:
+        return cls._create(value)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({repr(self.value)})"
@@ -129,7 +176,7 @@ class Some(Option[Tp], extractor.Extractor):
         return self.value
 
     def map(self, func: Callable[[Tp], TTp], /) -> Option[TTp]:
-        return Some[TTp](func(self.value))
+        return Some(func(self.value))
 
     def flat_map(self, func: Callable[[Tp], Option[TTp]], /) -> Option[TTp]:
         return func(self.value)
@@ -154,6 +201,19 @@ class Some(Option[Tp], extractor.Extractor):
         return self
 
 
+class LazyOption(monad.Lazy[Tp], Option[Tp]):
+    """Option evaluated on demand"""
+
+    def evaluate(self) -> Option[Tp]:
+        return cast("Option[Tp]", super().evaluate())
+
+    def is_empty(self) -> bool:
+        return self.evaluate().is_empty()
+
+    def not_empty(self) -> bool:
+        return self.evaluate().not_empty()
+
+
 SubType: TypeAlias = Void[Tp] | Some[Tp]
 OptionDo: TypeAlias = Generator[Option[Any], None, Tp]
 VOID = Void[Any]()
@@ -1,14 +1,41 @@
 import inspect
+import sys
+from collections.abc import Generator, Mapping, Sequence
+from concurrent.futures import Future
 from copy import deepcopy
-from typing import Any, Callable, NamedTuple, Optional, ParamSpec, TypeAlias, cast
+from enum import IntEnum
+from itertools import islice
+from queue import Full, Queue
+from random import random
+from threading import Lock, Thread
+from time import monotonic
+from types import CodeType, FrameType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Collection,
+    NamedTuple,
+    Optional,
+    ParamSpec,
+    TypeAlias,
+    cast,
+)
+
+from . import extractor
 
 P = ParamSpec("P")
 Arguments: TypeAlias = dict[str, Any]
 
 MASK = "****"
+TRUNCATED = "..."
+CYCLE = "<cycle>"
+DEPTH = 16
+ELEMENTS = 10_000
+INTERNED = 4_096
 
 
-def masking(*, arguments: dict[Any, Any], unmask: Optional[tuple[Any, ...]]) -> dict[Any, Any]:
+def masking(*, arguments: dict[Any, Any], unmask: Optional[Collection[Any]]) -> dict[Any, Any]:
     return {
         key: MASK if (unmask is None) or (key not in unmask) else value
         for key, value in arguments.items()
@@ -65,67 +92,335 @@ def apply_parameters(arguments: Arguments, /, *args: ..., **kwargs: ...) -> Argu
 
 def arguments(function: Callable[P, Any], /, *args: P.args, **kwargs: P.kwargs) -> Arguments:
     """Derive function arguments."""
-    arguments = deepcopy(inspect.signature(function).parameters.copy())
-    if len(arguments) == 0:
-        return arguments
+    return bind(binding(function), *args, **kwargs)
+
+
+class Binding(NamedTuple):
+    """Parameters of a function, read once from its signature."""
 
-    default_applied_arguments = apply_defaults(arguments=arguments, function=function)
-    parameter_applied_arguments = apply_parameters(default_applied_arguments, *args, **kwargs)
+    names: tuple[str, ...]
+    keywords: frozenset[str]
+    positions: tuple[str, ...]
+    defaults: Arguments
+    var_positional: Optional[str]
+    var_keyword: Optional[str]
 
-    return parameter_applied_arguments
+
+def binding(function: Callable[..., Any], /) -> Binding:
+    """Binding plan of the function, to bind arguments without the signature."""
+    parameters = inspect.signature(function).parameters.values()
+    kinds = {parameter.kind: parameter.name for parameter in parameters}
+    return Binding(
+        names=tuple(parameter.name for parameter in parameters),
+        keywords=frozenset(
+            parameter.name
+            for parameter in parameters
+            if parameter.kind
+            in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        ),
+        positions=tuple(
+            parameter.name
+            for parameter in parameters
+            if parameter.kind
+            in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        ),
+        defaults={
+            parameter.name: parameter.default
+            for parameter in parameters
+            if parameter.default is not inspect.Parameter.empty
+        },
+        var_positional=kinds.get(inspect.Parameter.VAR_POSITIONAL),
+        var_keyword=kinds.get(inspect.Parameter.VAR_KEYWORD),
+    )
+
+
+def bind(plan: Binding, /, *args: Any, **kwargs: Any) -> Arguments:
+    """Bind parameters by the plan, in signature order, without copying their values."""
+    bound = plan.defaults | dict(zip(plan.positions, args))
+    if plan.var_positional is not None:
+        bound[plan.var_positional] = args[len(plan.positions) :]
+    if plan.var_keyword is None:
+        bound.update(kwargs)
+    else:
+        bound[plan.var_keyword] = {
+            key: value for key, value in kwargs.items() if key not in plan.keywords
+        }
+        bound.update((key, value) for key, value in kwargs.items() if key in plan.keywords)
+    arguments = {name: bound.pop(name) for name in plan.names if name in bound}
+    return arguments | bound
 
 
 def is_private_attribute(attribute: str) -> bool:
     return attribute.startswith("_")
 
 
-def parse(object_: Any) -> Any:
-    """Recursively decompose object structure."""
+def parse(object_: Any, /, *, depth: int = DEPTH, elements: int = ELEMENTS) -> Any:
+    """Recursively decompose object structure.
+
+    Containers nested deeper than depth are replaced by TRUNCATED, and only the
+    first elements items over all containers are decomposed, the rest being
+    marked by TRUNCATED. A container that contains itself is replaced by CYCLE.
+    Other sequences, such as Vector, are decomposed into lists and other mappings
+    into dicts.
+    """
+    budget = elements
+    path: set[int] = set()
+
+    def take(collection: Collection[Any], /) -> tuple[list[Any], bool]:
+        nonlocal budget
+        taken = list(islice(collection, max(budget, 0)))
+        budget -= len(taken)
+        return taken, len(taken) < len(collection)
 
-    def recursive(parse_object: Any, /) -> Any:
+    def recursive(parse_object: Any, level: int, /) -> Any:
         match parse_object:
             case _ if callable(parse_object):
                 return inspect.signature(parse_object)
-            case _ if hasattr(parse_object, "__dict__"):
-                return {
-                    recursive(key): MASK if is_private_attribute(key) else recursive(value)
-                    for key, value in dict(cast(dict[str, Any], parse_object.__dict__)).items()
-                }
+            case str() | bytes() | int() | float() | bool() | None:
+                return parse_object
+            case _ if depth <= level:
+                return TRUNCATED
+            case _ if id(parse_object) in path:
+                return CYCLE
+        path.add(id(parse_object))
+        try:
+            return decompose(parse_object, level + 1)
+        finally:
+            path.remove(id(parse_object))
+
+    def decompose(parse_object: Any, level: int, /) -> Any:
+        match parse_object:
+            case extractor.Immutable():
+                items, truncated = take(
+                    tuple(zip(parse_object.__match_args__, parse_object.unapply()))
+                )
+                return {key: recursive(value, level) for key, value in items} | (
+                    {TRUNCATED: TRUNCATED} if truncated else {}
+                )
             case list():
-                return [recursive(item) for item in cast(list[Any], parse_object)]
+                items, truncated = take(cast(list[Any], parse_object))
+                return [recursive(item, level) for item in items] + (
+                    [TRUNCATED] if truncated else []
+                )
             case tuple():
-                return tuple(recursive(item) for item in cast(tuple[Any, ...], parse_object))
+                items, truncated = take(cast(tuple[Any, ...], parse_object))
+                return tuple(recursive(item, level) for item in items) + (
+                    (TRUNCATED,) if truncated else ()
+                )
             case set():
-                return {recursive(item) for item in cast(set[Any], parse_object)}
+                items, truncated = take(cast(set[Any], parse_object))
+                return {recursive(item, level) for item in items} | (
+                    {TRUNCATED} if truncated else set()
+                )
             case dict():
+                items, truncated = take(cast(dict[Any, Any], parse_object).items())
+                return {recursive(key, level): recursive(value, level) for key, value in items} | (
+                    {TRUNCATED: TRUNCATED} if truncated else {}
+                )
+            case Sequence():
+                items, truncated = take(cast(Sequence[Any], parse_object))
+                return [recursive(item, level) for item in items] + (
+                    [TRUNCATED] if truncated else []
+                )
+            case Mapping():
+                items, truncated = take(cast(Mapping[Any, Any], parse_object).items())
+                return {recursive(key, level): recursive(value, level) for key, value in items} | (
+                    {TRUNCATED: TRUNCATED} if truncated else {}
+                )
+            case _ if hasattr(parse_object, "__dict__"):
+                items, truncated = take(cast(dict[str, Any], parse_object.__dict__).items())
                 return {
-                    recursive(key): recursive(value)
-                    for key, value in cast(dict[Any, Any], parse_object.items())
-                }
+                    recursive(key, level): MASK
+                    if is_private_attribute(key)
+                    else recursive(value, level)
+                    for key, value in items
+                } | ({TRUNCATED: TRUNCATED} if truncated else {})
             case _:
                 return parse_object
 
-    return recursive(object_)
+    return recursive(object_, 0)
+
+
+class Capture(IntEnum):
+    """Frame capture level"""
+
+    OFF = 0
+    CALL_SITE = 1
+    FULL = 2
+
+
+class CallSite(NamedTuple):
+    """Location of a frame, shared by every frame at the same code and line"""
+
+    filename: str
+    lineno: int
+    function: str
+
+
+_CALL_SITES: dict[tuple[CodeType, int], CallSite] = {}
+_NAMES: dict[tuple[str, ...], tuple[str, ...]] = {}
+_INTERN_LOCK = Lock()
+
+
+def _intern(table: dict[Any, Any], key: Any, value: Any, /) -> Any:
+    """Store value once, evicting the oldest entry of a table holding INTERNED entries."""
+    with _INTERN_LOCK:
+        while key not in table and INTERNED <= len(table):
+            del table[next(iter(table))]
+        return table.setdefault(key, value)
+
+
+def call_site(code: CodeType, line: int, /) -> CallSite:
+    """Interned CallSite of the line of the code object.
+
+    The table keeps the code objects of its INTERNED most recently added call
+    sites alive, including generated ones such as compiled do-notation.
+    """
+    if (site := _CALL_SITES.get((code, line))) is None:
+        site = _intern(_CALL_SITES, (code, line), CallSite(code.co_filename, line, code.co_name))
+    return site
 
 
 class Frame:
+    """Location, variables and stack where the Frame is created
+
+    The calling frame is looked up once and not kept. Frames at the same code and
+    line share one CallSite; FULL also records the interned local names, the
+    unmasked values and the CallSite of each outer frame. Set Frame.CAPTURE to
+    change the level of every Frame, or CAPTURE of a subclass for its instances.
+    """
+
     DEPTH: int = 1
+    CAPTURE: Capture = Capture.FULL
 
     def __init__(self, /, depth: Optional[int] = None, unmask: Optional[tuple[str, ...]] = None):
-        target_depth = self.DEPTH if depth is None else depth
-        self.filename: str = inspect.stack()[target_depth].filename
-        self.line: int = inspect.stack()[target_depth].frame.f_lineno
-        self.function: str = inspect.stack()[target_depth].function
-        self.variables: dict[str, Any] = masking(
-            arguments=inspect.getargvalues(inspect.stack()[target_depth].frame).locals,
-            unmask=unmask,
-        )
-        self.stack: list[inspect.FrameInfo] = inspect.stack()
+        self._site: Optional[CallSite] = None
+        self._names: tuple[str, ...] = ()
+        self._unmasked: Optional[dict[str, Any]] = None
+        self._stack: tuple[CallSite, ...] = ()
+        if self.CAPTURE == Capture.OFF:
+            return
+        frame = sys._getframe(self.DEPTH if depth is None else depth)
+        self._site = call_site(frame.f_code, frame.f_lineno)
+        if self.CAPTURE == Capture.FULL:
+            locals_ = frame.f_locals
+            names = tuple(locals_)
+            if (interned := _NAMES.get(names)) is None:
+                interned = _intern(_NAMES, names, names)
+            self._names = interned
+            if unmask is not None:
+                self._unmasked = {name: locals_[name] for name in unmask if name in locals_}
+            self._stack = tuple(_outer_call_sites(frame))
+
+    @property
+    def filename(self) -> str:
+        return "" if self._site is None else self._site.filename
+
+    @property
+    def line(self) -> int:
+        return 0 if self._site is None else self._site.lineno
+
+    @property
+    def function(self) -> str:
+        return "" if self._site is None else self._site.function
 
+    @property
+    def variables(self) -> dict[str, Any]:
+        unmasked = {} if self._unmasked is None else self._unmasked
+        return {name: unmasked.get(name, MASK) for name in self._names}
 
-class RuntimeErrorReport(NamedTuple):
-    arguments: Arguments
-    debug: Optional[Exception | Any]
+    @property
+    def stack(self) -> tuple[CallSite, ...]:
+        return self._stack
+
+
+def _outer_call_sites(frame: Optional[FrameType], /) -> Generator[CallSite, None, None]:
+    while frame is not None:
+        yield call_site(frame.f_code, frame.f_lineno)
+        frame = frame.f_back
+
+
+class RuntimeErrorReport:
+    """Arguments and debugger result of a Failure
+
+    The masked arguments are kept as they are and parsed on first access, within
+    the DEPTH and ELEMENTS budgets, so they reflect the objects at that time.
+    """
+
+    __slots__ = ("_masked", "_arguments", "debug")
+
+    DEPTH: ClassVar[int] = DEPTH
+    ELEMENTS: ClassVar[int] = ELEMENTS
+    # Global policy of Sampler, used where Try.hold leaves sample or rate_limit unset.
+    SAMPLE: ClassVar[float] = 1.0
+    RATE_LIMIT: ClassVar[Optional[int]] = None
+    WINDOW: ClassVar[float] = 1.0
+
+    def __init__(self, *, arguments: Arguments, debug: Optional[Exception | Any]):
+        self._masked = arguments
+        self._arguments: Optional[Arguments] = None
+        self.debug = debug
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(arguments={self.arguments!r}, debug={self.debug!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        match other:
+            case RuntimeErrorReport():
+                return (self.arguments, self.debug) == (other.arguments, other.debug)
+            case _:
+                return NotImplemented
+
+    @property
+    def arguments(self) -> Arguments:
+        if self._arguments is None:
+            self._arguments = parse(self._masked, depth=self.DEPTH, elements=self.ELEMENTS)
+            self._masked = {}
+        return self._arguments
+
+
+class SuppressedErrorReport(NamedTuple):
+    """Report of a Failure without RuntimeErrorReport, counting the failures since the
+    last RuntimeErrorReport of the same call site."""
+
+    suppressed: int
+
+
+class Sampler:
+    """Selects the failures of a call site that get a RuntimeErrorReport
+
+    At most rate_limit failures per WINDOW seconds, each kept with probability
+    sample. None falls back to the global policy of RuntimeErrorReport.
+    """
+
+    __slots__ = ("sample", "rate_limit", "_window_start", "_reported", "_suppressed", "_lock")
+
+    def __init__(self, *, sample: Optional[float] = None, rate_limit: Optional[int] = None):
+        self.sample = sample
+        self.rate_limit = rate_limit
+        self._window_start = 0.0
+        self._reported = 0
+        self._suppressed = 0
+        self._lock = Lock()
+
+    def admit(self) -> Optional[SuppressedErrorReport]:
+        """None when the failure gets a RuntimeErrorReport, otherwise the count report."""
+        sample = RuntimeErrorReport.SAMPLE if self.sample is None else self.sample
+        rate_limit = RuntimeErrorReport.RATE_LIMIT if self.rate_limit is None else self.rate_limit
+        with self._lock:
+            if rate_limit is not None:
+                now = monotonic()
+                if RuntimeErrorReport.WINDOW <= now - self._window_start:
+                    self._window_start = now
+                    self._reported = 0
+            if (rate_limit is None or self._reported < rate_limit) and (
+                1.0 <= sample or random() < sample
+            ):
+                self._reported += 1
+                self._suppressed = 0
+                return None
+            self._suppressed += 1
+            return SuppressedErrorReport(suppressed=self._suppressed)
 
 
 def execute_debugger(
@@ -138,3 +433,60 @@ def execute_debugger(
         return debugger(arguments)
     except Exception as exception:
         return exception
+
+
+Debug: TypeAlias = tuple[Future[Any], Callable[[Arguments], Any], Arguments]
+
+
+class DebuggerWorker:
+    """Runs debuggers on a daemon thread
+
+    The thread starts with the first debugger, and again when it is no longer
+    alive, as in a forked child. When QUEUE_SIZE debuggers are pending, further
+    debuggers are dropped and their future is cancelled. An exception escaping
+    a debugger, such as SystemExit, is set on its future.
+    """
+
+    QUEUE_SIZE: ClassVar[int] = 1024
+
+    def __init__(self):
+        self._queue: Optional[Queue[Debug]] = None
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+
+    def submit(
+        self, debugger: Optional[Callable[[Arguments], Any]], arguments: Arguments
+    ) -> Future[Optional[Exception | Any]]:
+        """Future of the execute_debugger result."""
+        future: Future[Optional[Exception | Any]] = Future()
+        if (debugger is None) or (arguments == {}):
+            future.set_result(None)
+            return future
+        try:
+            self._started().put_nowait((future, debugger, arguments))
+        except Full:
+            future.cancel()
+        return future
+
+    def _started(self) -> Queue[Debug]:
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    queue: Queue[Debug] = Queue(maxsize=self.QUEUE_SIZE)
+                    thread = Thread(target=self._run, args=(queue,), daemon=True)
+                    thread.start()
+                    self._queue, self._thread = queue, thread
+        return cast(Queue[Debug], self._queue)
+
+    @staticmethod
+    def _run(queue: Queue[Debug], /) -> None:
+        while True:
+            future, debugger, arguments = queue.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(execute_debugger(debugger=debugger, arguments=arguments))
+                except BaseException as exception:
+                    future.set_exception(exception)
+
+
+DEBUGGER_WORKER = DebuggerWorker()
@@ -0,0 +1,207 @@
+"""Sink"""
+from __future__ import annotations
+
+import json
+from collections.abc import Generator
+from concurrent.futures import Future
+from pathlib import Path
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from time import monotonic, time
+from typing import Any, BinaryIO
+
+from . import collection, processor
+
+_CLOSE = object()
+
+
+class JsonLinesSink:
+    """Writes reports and frames to a file as JSON lines from a background thread
+
+    emit only builds the records of its argument. Encoding and writing happen on
+    the thread, once batch_size records or buffer_size bytes are buffered, or
+    flush_interval seconds after the last write. When the file would exceed
+    max_bytes it is rotated to path.1 ... path.{backups}; when rotation fails the
+    file keeps growing and rotation is retried on the next write. Records emitted
+    while queue_size records are pending, records that cannot be encoded and
+    records lost to a failed write are dropped and counted by dropped.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        /,
+        *,
+        batch_size: int = 100,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        max_bytes: int = 10 * 1024 * 1024,
+        backups: int = 5,
+        queue_size: int = 10_000,
+    ):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.dropped = 0
+        self._dropped_lock = Lock()
+        self._queue: Queue[Any] = Queue(maxsize=queue_size)
+        self._open()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> JsonLinesSink:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def emit(self, object_: Any, /) -> None:
+        """Queue the records of object_, see records."""
+        for record in records(object_):
+            try:
+                self._queue.put_nowait(record)
+            except Full:
+                self._drop(1)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Write the queued records, waiting at most timeout seconds."""
+        if not self._thread.is_alive():
+            return False
+        flushed = Event()
+        self._queue.put(flushed)
+        return flushed.wait(timeout)
+
+    def close(self) -> None:
+        """Write the queued records and close the file."""
+        if self._thread.is_alive():
+            self._queue.put(_CLOSE)
+            self._thread.join()
+
+    def _drop(self, count: int, /) -> None:
+        with self._dropped_lock:
+            self.dropped += count
+
+    def _run(self) -> None:
+        try:
+            self._loop()
+        finally:
+            self._file.close()
+
+    def _loop(self) -> None:
+        lines: list[bytes] = []
+        size = 0
+        deadline = monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - monotonic(), 0.0))
+            except Empty:
+                item = None
+            if isinstance(item, dict):
+                try:
+                    line = json.dumps(_jsonable(item), ensure_ascii=False).encode() + b"\n"
+                except Exception:
+                    self._drop(1)
+                    continue
+                lines.append(line)
+                size += len(line)
+                if len(lines) < self.batch_size and size < self.buffer_size:
+                    continue
+            if lines:
+                try:
+                    self._write(b"".join(lines))
+                except (OSError, ValueError):
+                    self._drop(len(lines))
+                lines.clear()
+                size = 0
+            deadline = monotonic() + self.flush_interval
+            if isinstance(item, Event):
+                item.set()
+            elif item is _CLOSE:
+                return
+
+    def _write(self, data: bytes, /) -> None:
+        if self._file.closed:
+            self._open()
+        if 0 < self._size and self.max_bytes < self._size + len(data):
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data)
+
+    def _open(self) -> None:
+        self._file: BinaryIO = open(self.path, "ab")
+        self._size = self._file.tell()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        try:
+            if 0 < self.backups:
+                for index in range(self.backups - 1, 0, -1):
+                    if (source := self.path.with_name(f"{self.path.name}.{index}")).exists():
+                        source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+                self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+            else:
+                self.path.unlink()
+        except OSError:
+            pass
+        self._open()
+
+
+def records(object_: Any, /) -> Generator[dict[str, Any], None, None]:
+    """Records of a RuntimeErrorReport, SuppressedErrorReport or Frame, or of the
+    ones in the args of an exception."""
+    match object_:
+        case BaseException():
+            for argument in object_.args:
+                for record in records(argument):
+                    yield {"exception": type(object_).__name__} | record
+        case processor.RuntimeErrorReport():
+            yield {
+                "type": "RuntimeErrorReport",
+                "time": time(),
+                "arguments": object_.arguments,
+                "debug": _debug(object_.debug),
+            }
+        case processor.SuppressedErrorReport(suppressed):
+            yield {"type": "SuppressedErrorReport", "time": time(), "suppressed": suppressed}
+        case processor.Frame():
+            yield {
+                "type": type(object_).__name__,
+                "time": time(),
+                "filename": object_.filename,
+                "line": object_.line,
+                "function": object_.function,
+                "variables": processor.parse(object_.variables),
+            }
+        case _:
+            return
+
+
+def _debug(debug: Any, /) -> Any:
+    match debug:
+        case Future() if debug.cancelled():
+            return "<cancelled>"
+        case Future() if debug.done():
+            return debug.result()
+        case Future():
+            return "<pending>"
+        case _:
+            return debug
+
+
+def _jsonable(value: Any, /) -> Any:
+    match value:
+        case str() | int() | float() | bool() | None:
+            return value
+        case dict():
+            return {
+                key if isinstance(key, str) else repr(key): _jsonable(item)
+                for key, item in value.items()
+            }
+        case list() | tuple() | set() | frozenset() | collection.Vector():
+            return [_jsonable(item) for item in value]
+        case _:
+            return repr(value)
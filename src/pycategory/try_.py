@@ -29,6 +29,8 @@ P = ParamSpec("P")
 class Try(ABC, monad.Monad[Tp], extension.Extension):
     """Try"""
 
+    __slots__ = ()
+
     @abstractmethod
     def __iter__(self) -> Generator[Try[Tp], None, Tp]:
         raise NotImplementedError()
@@ -39,7 +41,7 @@ class Try(ABC, monad.Monad[Tp], extension.Extension):
 
     @staticmethod
     def pure(value: T) -> Try[T]:
-        return Success[T](value)
+        return Success(value)
 
     @abstractmethod
     def flat_map(self, func: Callable[[Tp], Try[TTp]], /) -> Try[TTp]:  # type: ignore
@@ -90,12 +92,39 @@ class Try(ABC, monad.Monad[Tp], extension.Extension):
     def pattern(self) -> SubType[Tp]:
         raise NotImplementedError()
 
+    def lazy(self) -> Try[Tp]:
+        """Evaluate map and flat_map on demand, in constant stack."""
+        return LazyTry(self)
+
+    @overload
+    @staticmethod
+    def do(context: Callable[P, Generator[Try[Any], None, Tp]], /) -> Callable[P, Try[Tp]]:
+        """map, flat_map combination syntax sugar."""
+
+    @overload
+    @staticmethod
+    def do(
+        *, compile: bool = False, unchecked: bool = False
+    ) -> Callable[[Callable[P, Generator[Try[Any], None, Tp]]], Callable[P, Try[Tp]]]:
+        """map, flat_map combination syntax sugar.
+
+        compile=True rewrites the context into plain code once.
+        unchecked=True skips the runtime type checks of the yielded monads.
+        """
+
     @staticmethod
     def do(  # type: ignore
-        context: Callable[P, Generator[Try[Any], None, Tp]], /
-    ) -> Callable[P, Try[Tp]]:
+        context: Optional[Callable[P, Generator[Try[Any], None, Tp]]] = None,
+        /,
+        *,
+        compile: bool = False,
+        unchecked: bool = False,
+    ) -> (
+        Callable[P, Try[Tp]]
+        | Callable[[Callable[P, Generator[Try[Any], None, Tp]]], Callable[P, Try[Tp]]]
+    ):
         """map, flat_map combination syntax sugar."""
-        return cast(Callable[P, Try[Tp]], monad.Monad.do(context))
+        return monad.Monad.do(context, compile=compile, unchecked=unchecked)  # type: ignore
 
     @overload
     @staticmethod
@@ -108,10 +137,18 @@ class Try(ABC, monad.Monad[Tp], extension.Extension):
         *,
         unmask: Optional[tuple[str, ...]] = None,
         debugger: Optional[Callable[[processor.Arguments], Any]] = None,
+        debugger_mode: Literal["inline", "background"] = "inline",
+        sample: Optional[float] = None,
+        rate_limit: Optional[int] = None,
     ) -> Callable[[Callable[P, Tp]], Callable[P, Try[Tp]]]:
         """Try context decorator
 
         Unmask and record arguments in case of Failure.
+        debugger_mode="background" runs the debugger on processor.DEBUGGER_WORKER,
+        the report debug being a Future of its result. The debugger gets a copy of
+        the arguments dict whose values are shared with the caller, not snapshotted.
+        sample and rate_limit limit the failures recorded per window, the others
+        only count; None uses the policy of processor.RuntimeErrorReport.
         """
 
     @staticmethod
@@ -121,11 +158,20 @@ class Try(ABC, monad.Monad[Tp], extension.Extension):
         *,
         unmask: Optional[tuple[str, ...]] = None,
         debugger: Optional[Callable[[processor.Arguments], Any]] = None,
+        debugger_mode: Literal["inline", "background"] = "inline",
+        sample: Optional[float] = None,
+        rate_limit: Optional[int] = None,
     ) -> Callable[P, Try[Tp]] | Callable[[Callable[P, Tp]], Callable[P, Try[Tp]]]:
         """Try context decorator"""
 
         def wrap(func: Callable[P, Tp], /) -> Callable[P, Try[Tp]]:
-            return _hold(func=func, unmask=unmask, debugger=debugger)
+            return _hold(
+                func=func,
+                unmask=unmask,
+                debugger=debugger,
+                debugger_mode=debugger_mode,
+                sampler=processor.Sampler(sample=sample, rate_limit=rate_limit),
+            )
 
         if func is None:
             return wrap
@@ -138,33 +184,50 @@ def _hold(
     func: Callable[P, Tp],
     unmask: Optional[tuple[str, ...]] = None,
     debugger: Optional[Callable[[processor.Arguments], Any]] = None,
+    debugger_mode: Literal["inline", "background"] = "inline",
+    sampler: processor.Sampler,
 ) -> Callable[P, Try[Tp]]:
+    plan = processor.binding(func)
+    unmask_set = None if unmask is None else frozenset(unmask)
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> Try[Tp]:
         try:
-            return Success[Tp](func(*args, **kwargs))
+            return Success(func(*args, **kwargs))
         except Exception as exception:
-            arguments = processor.arguments(func, *args, **kwargs)
-            masked_arguments = processor.masking(arguments=arguments, unmask=unmask)
-            parsed_arguments = processor.parse(masked_arguments)
-            debug = processor.execute_debugger(debugger=debugger, arguments=arguments)
+            if (suppressed := sampler.admit()) is not None:
+                exception.args = tuple(collection.Vector(exception.args).append(suppressed))
+                return Failure(exception)
+            arguments = processor.bind(plan, *args, **kwargs)
+            masked_arguments = processor.masking(arguments=arguments, unmask=unmask_set)
+            match debugger_mode:
+                case "background":
+                    debug = processor.DEBUGGER_WORKER.submit(debugger, dict(arguments))
+                case _:
+                    debug = processor.execute_debugger(debugger=debugger, arguments=arguments)
             report = processor.RuntimeErrorReport(
-                arguments=parsed_arguments,
+                arguments=masked_arguments,
                 debug=debug,
             )
             exception.args = tuple(collection.Vector(exception.args).append(report))
-            return Failure[Tp](exception)
+            return Failure(exception)
 
     return wrapper
 
 
-class Failure(Try[Tp], extractor.Extractor):
+class Failure(Try[Tp], extractor.Immutable):
     """Failure"""
 
+    __slots__ = ("exception",)
+
     __match_args__ = ("exception",)
 
-    def __init__(self, exception: Exception, /):
-        self.exception = exception
+    exception: Exception
+
+    short_circuit = True
+
+    def __new__(cls, exception: Exception, /) -> Failure[Tp]:
+        return cls._create(exception)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({repr(self.exception)})"
@@ -177,22 +240,22 @@ class Failure(Try[Tp], extractor.Extractor):
                 return False
 
     def __iter__(self) -> Generator[Try[Tp], None, Tp]:
-        raise GeneratorExit(self) from self.exception
+        return iter((self,))  # type: ignore # Yielded once to short circuit
 
     def map(self, _: Callable[[Tp], TTp], /) -> Try[TTp]:
-        return cast(Failure[TTp], self)
+        return cast("Failure[TTp]", self)
 
     def flat_map(self, _: Callable[[Tp], Try[TTp]], /) -> Try[TTp]:
-        return cast(Failure[TTp], self)
+        return cast("Failure[TTp]", self)
 
     def recover(self, func: Callable[[Exception], TTp], /) -> Try[TTp]:
         try:
             if (result := func(self.exception)) is None:
-                return cast(Failure[TTp], self)
+                return cast("Failure[TTp]", self)
             else:
-                return Success[TTp](result)
+                return Success(result)
         except Exception as exception:
-            return Failure[TTp](exception)
+            return Failure(exception)
 
     def recover_with(self, func: Callable[[Exception], Try[TTp]], /) -> Try[TTp]:
         return func(self.exception)
@@ -230,13 +293,17 @@ class Failure(Try[Tp], extractor.Extractor):
         return self
 
 
-class Success(Try[Tp], extractor.Extractor):
+class Success(Try[Tp], extractor.Immutable):
     """Success"""
 
+    __slots__ = ("value",)
+
     __match_args__ = ("value",)
 
-    def __init__(self, value: Tp, /):
-        self.value = value
+    value: Tp
+
+    def __new__(cls, value: Tp, /) -> Success[Tp]:
+        return cls._create(value)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.value})"
@@ -253,16 +320,16 @@ class Success(Try[Tp], extractor.Extractor):
         return self.value
 
     def map(self, func: Callable[[Tp], TTp], /) -> Try[TTp]:
-        return Success[TTp](func(self.value))
+        return Success(func(self.value))
 
     def flat_map(self, func: Callable[[Tp], Try[TTp]], /) -> Try[TTp]:
         return func(self.value)
 
     def recover(self, _: Callable[[Exception], TTp], /) -> Try[TTp]:
-        return cast(Try[TTp], self)
+        return cast("Try[TTp]", self)
 
     def recover_with(self, _: Callable[[Exception], Try[TTp]], /) -> Try[TTp]:
-        return cast(Try[TTp], self)
+        return cast("Try[TTp]", self)
 
     @property
     def to_either(self) -> either.Either[Exception, Tp]:
@@ -270,7 +337,7 @@ class Success(Try[Tp], extractor.Extractor):
 
     @property
     def to_option(self) -> option.Option[Tp]:
-        return option.Some[Tp](self.value)
+        return option.Some(self.value)
 
     def fold(
         self,
@@ -297,5 +364,32 @@ class Success(Try[Tp], extractor.Extractor):
         return self
 
 
+class LazyTry(monad.Lazy[Tp], Try[Tp]):
+    """Try evaluated on demand"""
+
+    def evaluate(self) -> Try[Tp]:
+        return cast("Try[Tp]", super().evaluate())
+
+    def recover(self, func: Callable[[Exception], TTp], /) -> Try[TTp]:
+        return self.evaluate().recover(func)
+
+    def recover_with(self, func: Callable[[Exception], Try[TTp]], /) -> Try[TTp]:
+        return self.evaluate().recover_with(func)
+
+    @property
+    def to_either(self) -> either.Either[Exception, Tp]:
+        return self.evaluate().to_either
+
+    @property
+    def to_option(self) -> option.Option[Tp]:
+        return self.evaluate().to_option
+
+    def is_failure(self) -> bool:
+        return self.evaluate().is_failure()
+
+    def is_success(self) -> bool:
+        return self.evaluate().is_success()
+
+
 SubType: TypeAlias = Failure[Tp] | Success[Tp]
 TryDo: TypeAlias = Generator[Try[Any], None, Tp]
@@ -1,7 +1,15 @@
+import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
+from functools import reduce
+from operator import add
 from typing import Generic, TypeVar
 
-from pycategory import Vector
+import pytest
+
+from pycategory import VOID, FloatVector, IntVector, Some, SortedVector, TreeMap, Vector
+from pycategory.collection import IndexedVector, VectorView
 
 T = TypeVar("T")
 
@@ -229,3 +237,360 @@ def test_immutable_vector_dataclass():
     number_entity_from_dict = SeqEntity[T](**dict_number_entity)
     assert {"value": [0, 1, 2]} == dict_number_entity == {"value": [0, 1, 2]}
     assert number_entity_from_dict == number_entity == number_entity_from_dict
+
+
+def test_vector_not_list():
+    vector = Vector([0, 1, 2])
+    assert not isinstance(vector, list)
+    with pytest.raises(TypeError):
+        json.dumps(vector)
+    assert "[0, 1, 2]" == json.dumps(list(vector))
+
+
+def test_vector_persistent():
+    size = 32 * 32 + 33
+    vector = Vector[int]()
+    versions = []
+    for element in range(size):
+        versions.append(vector)
+        vector = vector.append(element)
+    assert list(range(size)) == vector == list(range(size))
+    assert all(list(range(length)) == version for length, version in enumerate(versions))
+    assert Vector(range(size)) == vector == Vector(range(size))
+
+    updated_vector = vector.updated(100, -1).updated(-1, -2)
+    assert -1 == updated_vector[100]
+    assert -2 == updated_vector[-1]
+    assert 100 == vector[100]
+    assert size - 1 == vector[-1]
+
+    poped_vector = vector
+    for length in reversed(range(size)):
+        poped_vector = poped_vector.pop(-1)
+        assert length == len(poped_vector)
+    assert [] == poped_vector == []
+    assert list(range(size)) == vector == list(range(size))
+
+
+def test_vector_builder():
+    builder = Vector[int].new_builder()
+    for element in range(100):
+        builder.add_one(element)
+    builder.add_all(range(100, 200))
+    vector = builder.result()
+    assert Vector is type(vector)
+    assert 200 == len(builder)
+    assert list(range(200)) == vector == list(range(200))
+    assert list(range(201)) == builder.add_one(200).result() == list(range(201))
+    assert list(range(200)) == vector == list(range(200))
+
+
+def test_vector_view():
+    called: list[int] = []
+
+    def double(value: int) -> int:
+        called.append(value)
+        return value * 2
+
+    vector = Vector(range(10))
+    view = vector.view().map(double).filter(lambda x: x % 3 == 0).map(str)
+    assert VectorView is type(view)
+    assert [] == called
+    forced_vector = view.to_vector()
+    assert Vector is type(forced_vector)
+    assert ["0", "6", "12", "18"] == forced_vector == ["0", "6", "12", "18"]
+    assert list(range(10)) == called
+    assert ["0", "6", "12", "18"] == list(view)
+    assert list(range(10)) == vector == list(range(10))
+
+    assert [1, 1, 2, 2, 3, 3] == Vector([1, 2, 3]).view().flat_map(lambda x: [x, x]).to_vector()
+    assert [2, 3, 4] == vector.view().drop(2).take(3).to_vector() == [2, 3, 4]
+    assert [] == vector.view().take(-1).to_vector() == []
+
+    called.clear()
+    assert [0, 2] == vector.view().map(double).take(2).to_vector()
+    assert [0, 1] == called
+
+
+def test_vector_slice():
+    vector = Vector(range(100))
+    sliced_vector = vector[10:90:3]
+    assert Vector is type(sliced_vector)
+    assert list(range(100))[10:90:3] == sliced_vector == list(range(100))[10:90:3]
+    assert list(range(100))[10:90:3][::-2] == sliced_vector[::-2]
+    assert 13 in sliced_vector
+    assert 14 not in sliced_vector
+    assert [10, 13, 16, 99] == sliced_vector.take(3).append(99) == [10, 13, 16, 99]
+    assert list(range(100))[10:90:3][:-1] == sliced_vector.pop(-1)
+    assert list(range(100)) == vector == list(range(100))
+    assert list(range(100))[10:90:3] == sliced_vector.copy() == list(range(100))[10:90:3]
+
+
+def test_vector_take_drop_tail():
+    vector = Vector([0, 1, 2])
+    assert [0, 1] == vector.take(2) == [0, 1]
+    assert [] == vector.take(-1) == []
+    assert [2] == vector.drop(2) == [2]
+    assert [0, 1, 2] == vector.drop(-1) == [0, 1, 2]
+    assert [1, 2] == vector.tail() == [1, 2]
+    assert [] == Vector([0]).tail() == []
+    try:
+        Vector[int]().tail()
+        assert False
+    except ValueError:
+        assert True
+    assert Vector is type(reversed(vector))
+    assert [2, 1, 0] == reversed(vector) == [2, 1, 0]
+
+
+def test_numeric_vector():
+    vector = IntVector(range(10))
+    assert IntVector is type(vector)
+    assert list(range(10)) == vector == list(range(10))
+    assert "q" == vector.to_memoryview().format
+    assert True is vector.to_memoryview().readonly
+    assert IntVector is type(vector.append(10))
+    assert IntVector is type(vector.filter(lambda x: x % 2 == 0))
+    assert IntVector is type(vector.sort(reverse=True))
+    assert IntVector is type(vector[::2])
+    assert [0, 2, 4] == vector.map(lambda x: x * 2).take(3) == [0, 2, 4]
+    assert IntVector is type(vector.map(lambda x: x * 2))
+    assert Vector is type(vector.map(str))
+    assert Vector is type(vector.map(lambda x: 0 < x))
+    assert Vector is type(vector.map(lambda x: x * 2**64))
+    assert 45 == vector.reduce(lambda left, right: left + right)
+    assert list(range(10)) == vector == list(range(10))
+
+    assert 45 == vector.sum()
+    assert 2**64 == IntVector([2**63 - 1, 2**63 - 1, 2]).sum()
+    assert -(2**64) == IntVector([-(2**63), -(2**63)]).sum()
+    assert 0 == IntVector().sum()
+    assert 0 == vector.min()
+    assert 9 == vector.max()
+    assert 4.5 == vector.mean()
+
+    float_vector = FloatVector([0.5, 1.5, 2])
+    assert "d" == float_vector.to_memoryview().format
+    assert 4.0 == float_vector.sum()
+    assert 0.5 == float_vector.min()
+    assert 2.0 == float_vector.max()
+    assert FloatVector is type(float_vector.updated(0, 1.0))
+    assert FloatVector is type(float_vector.append(1))
+    assert 0 == FloatVector().sum()
+
+    one = IntVector([1])
+    assert Vector is type(one.append(1.5))
+    assert [1, 1.5] == one.append(1.5) == [1, 1.5]
+    assert [1, 2**70] == one.append(2**70) == [1, 2**70]
+    assert [1, 0.5] == one.extend(element / 2 for element in [1]) == [1, 0.5]
+    assert [1, "a"] == one + ["a"] == [1, "a"]
+    assert ["x"] == one.updated(0, "x") == ["x"]
+    assert [0.5, 1] == one.insert(index=0, obj=0.5) == [0.5, 1]
+    assert Vector is type(FloatVector([0.5]).append("a"))
+    assert IntVector is type(one)
+    try:
+        one.updated(1, 0.5)
+        assert False
+    except IndexError:
+        assert True
+    try:
+        FloatVector().mean()
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_numeric_vector_vectorized():
+    vector = IntVector(range(10))
+    assert IntVector is type(vector.map(lambda x: x * 3, vectorized=True))
+    assert [0, 3, 6] == vector.map(lambda x: x * 3, vectorized=True).take(3) == [0, 3, 6]
+    assert [0, 2, 4, 6, 8] == vector.filter(lambda x: x % 2 == 0, vectorized=True)
+    assert [9, 8, 7, 6] == vector.reverse().filter(lambda x: 5 < x, vectorized=True)
+    assert FloatVector is type(FloatVector([1.5]).filter(lambda x: 0 < x, vectorized=True))
+
+
+def test_numeric_vector_numpy():
+    numpy = pytest.importorskip("numpy")
+
+    vector = IntVector(range(10))
+    assert FloatVector is type(vector.map(numpy.sqrt))
+    assert [0.0, 1.0, 2.0] == IntVector([0, 1, 4]).map(numpy.sqrt) == [0.0, 1.0, 2.0]
+    assert [0, -3, -6, -9] == vector[::3].map(numpy.negative) == [0, -3, -6, -9]
+    assert Vector is type(vector.map(numpy.isfinite))
+    assert [2, 4] == vector.filter(lambda x: (0 < x) & (x < 5) & (x % 2 == 0), vectorized=True)
+    assert 45 == vector.reduce(numpy.add)
+    assert int is type(vector.sum())
+    assert 45 == vector.sum()
+    assert 4.5 == vector.mean()
+
+
+def test_vector_par_map_par_reduce():
+    vector = Vector(range(1000))
+    assert [x * 2 for x in range(1000)] == vector.par_map(lambda x: x * 2)
+    assert Vector is type(vector.par_map(lambda x: x * 2, chunksize=7))
+    assert [] == Vector[int]().par_map(str) == []
+    assert sum(range(1000)) == vector.par_reduce(add)
+    assert "0123456789" == Vector(list("0123456789")).par_reduce(add, chunksize=1)
+    try:
+        Vector[int]().par_reduce(add)
+        assert False
+    except TypeError:
+        assert True
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert [str(x) for x in range(100)] == vector.take(100).par_map(
+            str, executor=executor, chunksize=10
+        )
+        assert sum(range(1000)) == vector.par_reduce(add, executor=executor)
+
+
+def test_vector_hash():
+    vector = Vector([0, 1, 2])
+    same_vector = Vector((0, 1, 2))
+    other_vector = Vector([0, 1, 3])
+    assert hash(vector) == hash(same_vector)
+    assert hash(vector) == vector._hash
+    assert {vector, other_vector} == {vector, same_vector, other_vector}
+    assert 42 == {vector: 42}[same_vector]
+    assert vector != other_vector
+    assert vector.copy() == vector
+    assert vector[:] is not vector
+    assert vector[:] == vector
+    try:
+        hash(Vector([[0]]))
+        assert False
+    except TypeError:
+        assert True
+
+
+def test_vector_concat():
+    chunks = [Vector(range(start, start + 50)) for start in range(0, 5000, 50)]
+    vector = reduce(lambda left, right: left + right, chunks, Vector[int]())
+    assert Vector is type(vector)
+    assert list(range(5000)) == vector == list(range(5000))
+    assert list(reversed(range(5000))) == reversed(vector)
+    assert 4999 in vector
+    assert [0, 1, 2, 3] == vector.take(4) == [0, 1, 2, 3]
+    storage = vector._storage
+    assert 4321 == vector[4321]
+    assert 4999 == vector[-1]
+    assert storage is vector._storage
+    assert list(range(5000)) + [-1] == vector.append(-1)
+    assert list(range(4999)) == vector.pop(-1)
+    assert -1 == vector.extend(chunks[0]).updated(123, -1)[123]
+    assert list(range(50)) == chunks[0] == list(range(50))
+
+
+def test_vector_concat_all():
+    vectors = [Vector(range(start, start + 40)) for start in range(0, 4000, 40)]
+    vector = Vector.concat_all([Vector[int](), *vectors, [4000], (4001, 4002)])
+    assert Vector is type(vector)
+    assert list(range(4003)) == vector == list(range(4003))
+    assert [] == Vector.concat_all([]) == []
+    assert IntVector is type(IntVector.concat_all([IntVector([0]), [1, 2]]))
+    assert [0, 1, 2] == IntVector.concat_all([IntVector([0]), [1, 2]]) == [0, 1, 2]
+
+
+def test_vector_indexed():
+    vector = Vector([3, 1, 4, 1, 5, 9, 2, 6]).indexed()
+    assert IndexedVector is type(vector)
+    assert vector is vector.indexed()
+    assert [3, 1, 4, 1, 5, 9, 2, 6] == vector
+    assert 9 in vector
+    assert 7 not in vector
+    assert 2 == vector.count(1)
+    assert 3 == vector.index(obj=1, start=2)
+    assert [3, 4, 1, 5, 9, 2, 6] == vector.remove(1)
+    assert 1 == vector.take(2).count(1)
+    assert 2 == vector.take(3).append(1).count(1)
+    assert 3 == vector.pop(-1).extend([1]).count(1)
+    assert 8 == (vector + Vector([7, 10])).index(obj=7)
+    try:
+        vector.index(obj=7)
+        assert False
+    except ValueError:
+        assert True
+    unhashable = Vector([[0], [1]]).indexed()
+    assert [1] in unhashable
+    assert 1 == unhashable.index(obj=[1])
+
+
+def test_vector_key_by():
+    vector = Vector(["apple", "avocado", "banana", "cherry"])
+    index = vector.indexed().key_by(lambda word: word[0])
+    assert ["apple", "avocado"] == index["a"]
+    assert ["cherry"] == index["c"]
+    assert ["a", "b", "c"] == list(index)
+    assert 3 == len(index)
+    assert "z" not in index
+    try:
+        index["z"]
+        assert False
+    except KeyError:
+        assert True
+
+
+def test_sorted_vector():
+    vector = SortedVector([5, 3, 9, 1, 3])
+    assert [1, 3, 3, 5, 9] == vector == [1, 3, 3, 5, 9]
+    assert [1, 3, 3, 4, 5, 9] == vector.add(4)
+    assert SortedVector is type(vector.add(10))
+    assert [0, 1, 3, 3, 5, 9] == vector.insert(index=0, obj=0)
+    assert Vector is type(vector.insert(index=0, obj=10))
+    assert [1, 10, 3, 3, 5, 9] == vector.insert(index=1, obj=10)
+    assert [1, 3, 3, 5, 9] == vector
+    assert Some(4) == vector.search(9)
+    assert VOID == vector.search(4)
+    assert 3 in vector
+    assert 4 not in vector
+    assert 2 == vector.count(3)
+    assert 2 == vector.index(obj=3, start=2)
+    assert [3, 3, 5] == vector.range(3, 9)
+    assert SortedVector is type(vector.range(3, 9))
+    assert [] == vector.range(9, 3)
+    assert vector is vector.sort()
+    assert [9, 5, 3, 3, 1] == vector.sort(reverse=True)
+    assert Vector is type(vector.reverse())
+    assert Vector is type(vector.append(0))
+    assert Vector is type(vector.map(str))
+
+
+def test_sorted_vector_merge():
+    odd = SortedVector(range(1, 100, 2))
+    even = SortedVector(range(0, 100, 2))
+    assert list(range(100)) == odd.merge(even) == list(range(100))
+    assert list(range(200)) == SortedVector(range(100, 200)).merge(SortedVector(range(100)))
+    assert [1, 2, 3] == SortedVector([3]).merge([2, 1])
+    assert SortedVector is type(odd.merge([]))
+
+
+def test_tree_map():
+    tree_map = TreeMap({3: "c", 1: "a", 2: "b"})
+    assert [1, 2, 3] == list(tree_map)
+    assert [(1, "a"), (2, "b"), (3, "c")] == list(tree_map.items())
+    assert {1: "a", 2: "b", 3: "c"} == tree_map
+    assert "b" == tree_map[2]
+    assert 4 not in tree_map
+    assert {1: "a", 2: "B", 3: "c"} == tree_map.updated(2, "B")
+    assert {1: "a", 3: "c"} == tree_map.removed(2)
+    assert tree_map is tree_map.removed(4)
+    assert {1: "a", 2: "b", 3: "c"} == tree_map
+    assert [2, 3] == list(tree_map.range(2, 4))
+    assert Some((2, "b")) == tree_map.floor(2)
+    assert Some((3, "c")) == tree_map.floor(9)
+    assert VOID == tree_map.floor(0)
+    assert Some((1, "a")) == tree_map.ceiling(0)
+    assert VOID == tree_map.ceiling(4)
+    assert {1: "x"} == TreeMap([(1, "a"), (1, "x")])
+    assert tree_map == pickle.loads(pickle.dumps(tree_map))
+    try:
+        tree_map[4]
+        assert False
+    except KeyError:
+        assert True
+
+    large = TreeMap((key, str(key)) for key in range(1000))
+    for key in range(0, 1000, 2):
+        large = large.removed(key)
+    assert list(range(1, 1000, 2)) == list(large)
+    assert list(range(101, 200, 2)) == list(large.range(100, 200))
@@ -405,3 +405,49 @@ def test_pattern_match():
             assert True
         case _:
             assert False
+
+
+def test_lazy():
+    from functools import reduce
+
+    from pycategory import Either, Left, Right
+
+    lazy = reduce(
+        lambda either, step: either.flat_map(lambda v: Right[str, int](v + step)),
+        range(100_000),
+        Right[str, int](0).lazy(),
+    )
+    assert 4_999_950_000 == lazy.get()
+    assert True is lazy.is_right()
+
+    def validate(value: int, /) -> Either[str, int]:
+        if value < 0:
+            return Left[str, int]("negative")
+        return Right[str, int](value).lazy().flat_map(lambda v: validate(v - 2))
+
+    left = validate(100_001)
+    assert Left("negative") == left
+    assert "negative" == left.fold(left=lambda v: v, right=lambda v: str(v))
+    match left.pattern:
+        case Left(value):
+            assert "negative" == value
+        case _:
+            assert False
+
+
+def test_immutable():
+    import pickle
+
+    from pycategory import Left, Right
+
+    for either in (Left(42), Right(42)):
+        assert not hasattr(either, "__dict__")
+        try:
+            either.value = 0  # type: ignore
+            assert False
+        except AttributeError:
+            assert either == pickle.loads(pickle.dumps(either))
+
+    assert Left(None) is Left(None)
+    assert Right(None) is Right(None)
+    assert Right(True) is not Left(True)
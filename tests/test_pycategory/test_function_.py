@@ -1,3 +1,7 @@
+from pycategory import curry
+from pycategory.function_ import Function1
+
+
 def test_function1():
     from pycategory.function_ import Function1
 
@@ -1345,3 +1349,82 @@ def test_function():
         lambda arg1, arg2, arg3, arg4, arg5, arg6, arg7, arg8, arg9, arg10, arg11, arg12, arg13, arg14, arg15, arg16, arg17, arg18, ar19, arg20, arg21, arg22: 42
     )
     assert Function22 is type(function22)
+
+
+def test_curry():
+    @curry
+    def function(arg1: list[int], /, arg2: int, arg3: int = 3, *, arg4: int = 4) -> list[int]:
+        return arg1 + [arg2, arg3, arg4]
+
+    payload = [1]
+    partial = function(payload)
+    assert isinstance(partial, Function1)
+    assert [1, 2, 3, 4] == partial(2)
+    assert [1, 5, 3, 4] == partial.apply(5)
+
+    @curry
+    def identity(arg1: list[int], arg2: int) -> list[int]:
+        return arg1
+
+    assert payload is identity(payload)(0)
+
+    try:
+        curry(lambda arg: arg)
+        assert False
+    except TypeError:
+        ...
+
+
+@curry
+def curried_add(arg1: int, arg2: int, arg3: int) -> int:
+    return arg1 + arg2 + arg3
+
+
+@Function1
+def increment(value: int) -> int:
+    return value + 1
+
+
+def multiply(arg1: int, arg2: int) -> int:
+    return arg1 * arg2
+
+
+def test_pickle():
+    import pickle
+    from concurrent.futures import ProcessPoolExecutor
+    from operator import add
+
+    from pycategory import function
+
+    partial = curried_add(1)(2)
+    composed = increment.compose(partial).and_then(str)
+    add2 = function(add)
+    assert 4 == pickle.loads(pickle.dumps(partial))(1)
+    assert "5" == pickle.loads(pickle.dumps(composed))(1)
+    assert 3 == pickle.loads(pickle.dumps(add2))(1, 2)
+    assert 6 == pickle.loads(pickle.dumps(function(multiply).curried(2)))(3)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert [4, 5, 6] == list(executor.map(partial, [1, 2, 3]))
+        assert ["5", "6", "7"] == list(executor.map(composed, [1, 2, 3]))
+        assert [3, 3] == list(executor.map(add2, [1, 2], [2, 1]))
+        assert [6] == list(executor.map(curried_add(1)(2), [3]))
+
+
+def test_function1_compose_flat():
+    import sys
+    from functools import reduce
+
+    from pycategory.function_ import Composition, Function1
+
+    stages = sys.getrecursionlimit() * 2
+    increments = [Function1[int, int](lambda value: value + 1) for _ in range(stages)]
+    and_then = reduce(lambda composed, stage: composed.and_then(stage), increments)
+    compose = reduce(lambda composed, stage: composed.compose(stage), increments)
+    assert stages == and_then(0) == compose(0)
+    assert Composition is type(and_then)
+    assert stages == len(and_then._functions)  # type: ignore
+
+    merged = and_then.and_then(compose)
+    assert 2 * stages == merged(0) == len(merged._functions)  # type: ignore
+    assert "x2" == Function1(str).compose(lambda v: v * 2).and_then(lambda v: "x" + v)(1)
@@ -1,16 +1,20 @@
-def test_do():
-    from pycategory import (
-        Either,
-        EitherDo,
-        Option,
-        OptionDo,
-        Right,
-        Some,
-        Success,
-        Try,
-        TryDo,
-    )
+from pycategory import (
+    VOID,
+    Either,
+    EitherDo,
+    Failure,
+    Left,
+    Option,
+    OptionDo,
+    Right,
+    Some,
+    Success,
+    Try,
+    TryDo,
+)
+
 
+def test_do():
     @Either.do
     def either_context() -> EitherDo[IndexError | KeyError, int]:
         _ = 42
@@ -41,3 +45,127 @@ def test_do():
         return result
 
     assert 42 == try_context().get()
+
+
+def test_do_compile():
+    @Either.do(compile=True)
+    def either_context(value: int, /, *, stop: bool = False) -> EitherDo[str, int]:
+        result = yield from Right[str, int](value)
+        if stop:
+            yield from Left[str, int]("stop")
+        for step in range(3):
+            result += yield from Right[str, int](step)
+        return result
+
+    assert Right(45) == either_context(42)
+    assert Left("stop") == either_context(42, stop=True)
+
+    @Option.do(compile=True)
+    def option_context(value: int) -> OptionDo[int]:
+        one = yield from Some[int](value)
+        two = yield from (VOID if one < 0 else Some[int](2))
+        return one + two
+
+    assert Some(3) == option_context(1)
+    assert VOID == option_context(-1)
+
+    def closure(offset: int, /):
+        @Try.do(compile=True)
+        def try_context() -> TryDo[int]:
+            nonlocal offset
+            offset += yield from Success[int](1)
+            return offset
+
+        return try_context
+
+    assert Success(43) == closure(42)()
+    assert closure(0).__code__ is closure(1).__code__
+
+    @Try.do(compile=True)
+    def none_context() -> TryDo[None]:
+        yield from Success[int](1)
+
+    assert Success(None) == none_context()
+
+
+def test_do_compile_type_error():
+    @Try.do(compile=True)
+    def different_context() -> TryDo[int]:
+        yield from Success[int](1)
+        yield from Right[Exception, int](1)  # type: ignore # Error case
+        return 1
+
+    try:
+        different_context()
+        assert False
+    except TypeError:
+        assert True
+
+    @Try.do(compile=True)
+    def no_context() -> TryDo[int]:
+        return 1
+        yield from Success[int](1)
+
+    try:
+        no_context()
+        assert False
+    except TypeError:
+        assert True
+
+    try:
+
+        @Try.do(compile=True)
+        def nested_context() -> TryDo[int]:
+            return (yield from Success[int](1)) + 1
+
+        assert False
+    except TypeError:
+        assert True
+
+
+def test_do_short_circuit():
+    finalized = []
+
+    @Option.do
+    def option_context() -> OptionDo[int]:
+        try:
+            one = yield from Some[int](1)
+            two = yield from VOID
+            return one + two
+        finally:
+            finalized.append(True)
+
+    assert VOID == option_context()
+    assert [True] == finalized
+
+    def validate(value: int, /) -> EitherDo[str, int]:
+        positive = yield from (Right[str, int](value) if 0 < value else Left[str, int]("positive"))
+        return positive
+
+    @Either.do
+    def either_context(value: int, /) -> EitherDo[str, int]:
+        one = yield from validate(value)
+        two = yield from Right[str, int](2)
+        return one + two
+
+    assert Right(3) == either_context(1)
+    assert Left("positive") == either_context(0)
+
+
+def test_do_unchecked():
+    @Try.do(unchecked=True)
+    def try_context(value: int, /) -> TryDo[int]:
+        one = yield from Success[int](value)
+        two = yield from (Success[int](2) if one else Failure[int](ValueError()))
+        return one + two
+
+    assert Success(3) == try_context(1)
+    assert Failure is type(try_context(0))
+
+    @Try.do(unchecked=True)
+    def different_context() -> TryDo[int]:
+        one = yield from Success[int](1)
+        two = yield from Right[Exception, int](2)  # type: ignore # Not checked
+        return one + two
+
+    assert 3 == different_context().get()
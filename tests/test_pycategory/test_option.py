@@ -261,3 +261,54 @@ def test_json_encode():
     re_dict_entity = cast(dict[str, Any], json.loads(json_entity))
     assert None is re_dict_entity.get("void")
     assert 42 == re_dict_entity.get("some")
+
+
+def test_lazy():
+    from functools import reduce
+
+    from pycategory import VOID, Option, Some, Void
+
+    def countdown(value: int, /) -> Option[int]:
+        return Some[int](value).lazy().flat_map(lambda v: countdown(v - 1) if v else Some(v))
+
+    assert Some(0) == countdown(100_000)
+
+    calls = []
+    lazy = reduce(lambda option, _: option.map(lambda v: v + 1), range(100_000), Some(0).lazy())
+    lazy = lazy.map(lambda v: calls.append(v) or v)
+    assert [] == calls
+    assert 100_000 == lazy.get()
+    assert 100_000 == lazy.get_or_else(lambda: None)
+    assert [100_000] == calls
+
+    void = Some(1).lazy().flat_map(lambda _: VOID).map(lambda v: calls.append(v))
+    assert True is void.is_empty()
+    assert None is void.fold(void=lambda: None, some=lambda v: v)
+    match void.pattern:
+        case Void():
+            assert True
+        case _:
+            assert False
+    assert [100_000] == calls
+
+
+def test_immutable():
+    import pickle
+    from copy import deepcopy
+
+    from pycategory import Some
+
+    some = Some(42)
+    assert not hasattr(some, "__dict__")
+    try:
+        some.value = 0  # type: ignore
+        assert False
+    except AttributeError:
+        assert 42 == some.get()
+
+    assert Some(None) is Some(None)
+    assert Some(True) is Some(True)
+    assert Some(False) is Some(False)
+    assert Some(1) is not Some(True)
+    assert Some(None) is pickle.loads(pickle.dumps(Some(None)))
+    assert Some([42]) == pickle.loads(pickle.dumps(Some([42]))) == deepcopy(Some([42]))
@@ -1,6 +1,26 @@
-def test_masking():
-    from pycategory import processor
+import gc
+import inspect
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from time import sleep
+from typing import Any, Callable, Optional, cast
+
+from pycategory import (
+    Either,
+    EitherDo,
+    Failure,
+    Frame,
+    Left,
+    Right,
+    TreeMap,
+    Try,
+    Vector,
+    processor,
+)
+
 
+def test_masking():
     half_masked_arguments = processor.masking(
         arguments={"mask": 42, "unmask": 42}, unmask=("unmask",)
     )
@@ -13,12 +33,6 @@ def test_masking():
 
 
 def test_apply_defaults():
-    import inspect
-    from copy import deepcopy
-    from typing import Optional
-
-    from pycategory import processor
-
     def position_defaults_arguments(arg1: int, arg2: Optional[int] = None, /):
         ...
 
@@ -55,11 +69,6 @@ def test_apply_defaults():
 
 
 def test_apply_parameter():
-    import inspect
-    from typing import Optional
-
-    from pycategory import processor
-
     def position_only_parameter(arg1: int, arg2: Optional[int] = None, /):
         ...
 
@@ -86,10 +95,6 @@ def test_apply_parameter():
 
 
 def test_arguments():
-    from typing import Optional
-
-    from pycategory import processor
-
     def position_only_no_default(position: int, /) -> None:
         ...
 
@@ -433,18 +438,11 @@ def test_arguments():
 
 
 def test_is_private():
-    from pycategory import processor
-
     assert False is processor.is_private_attribute("public")
     assert True is processor.is_private_attribute("_private")
 
 
 def test_parse():
-    import inspect
-    from typing import Any, Callable
-
-    from pycategory import processor
-
     class Sample:
         def __init__(
             self,
@@ -537,9 +535,51 @@ def test_parse():
     } == parsed_sample
 
 
-def test_frame():
-    from pycategory import Either, EitherDo, Frame, Left, Right, processor
+def test_parse_bounded():
+    assert [0, 1, 2, processor.TRUNCATED] == processor.parse(list(range(1_000_000)), elements=3)
+    assert {0: [0, processor.TRUNCATED], 1: [processor.TRUNCATED]} == processor.parse(
+        {0: [0, 1, 2], 1: [0]}, elements=3
+    )
+    assert [[processor.TRUNCATED], 42] == processor.parse([[[42]], 42], depth=2)
+
+    cyclic: list[Any] = [42]
+    cyclic.append(cyclic)
+    assert [42, processor.CYCLE] == processor.parse(cyclic)
+
+    class Node:
+        def __init__(self):
+            self.node = self
+
+    assert {"node": processor.CYCLE} == processor.parse(Node())
+    shared = [42]
+    assert [[42], [42]] == processor.parse([shared, shared])
 
+
+def test_parse_bounded_collection():
+    class Row:
+        def __init__(self, value: int):
+            self.value = value
+            self._secret = "secret"
+
+    assert [0, 1, 2, processor.TRUNCATED] == processor.parse(Vector(range(1_000)), elements=3)
+    assert [{"value": 42, "_secret": processor.MASK}] == processor.parse(Vector([Row(42)]))
+    assert [processor.TRUNCATED] == processor.parse(Vector([Vector([42])]), depth=1)
+    assert {0: "0", processor.TRUNCATED: processor.TRUNCATED} == processor.parse(
+        TreeMap([(0, "0"), (1, "1")]), elements=1
+    )
+
+    @Try.hold(unmask=("rows",))
+    def hold_context(rows: Vector[int]) -> None:
+        raise ValueError("error")
+
+    failure = cast(Failure[None], hold_context(Vector(range(200_000))))
+    report = cast(processor.RuntimeErrorReport, failure.exception.args[-1])
+    assert isinstance(report.arguments["rows"], list)
+    assert len(report.arguments["rows"]) <= processor.ELEMENTS + 1
+    assert processor.TRUNCATED == report.arguments["rows"][-1]
+
+
+def test_frame():
     def function(arg1: int, arg2: int, arg3: int) -> Frame:
         variable1 = 42  # type: ignore # Frame parameter
         variable2 = 42  # type: ignore # Frame parameter
@@ -571,9 +611,87 @@ def test_frame():
     assert 42 == result.left().get().variables.get("unmask", None)
 
 
-def test_execute_debugger():
-    from pycategory import processor
+def test_frame_capture():
+    class Error(Frame):
+        ...
+
+    def function(value: int) -> Error:
+        return Error(unmask=("value",))
+
+    full = function(42)
+    assert __file__ == full.filename
+    assert "function" == full.function
+    assert function.__code__.co_firstlineno + 1 == full.line
+    assert {"value": 42, "Error": processor.MASK} == full.variables
+    assert "function" == full.stack[0].function
+
+    Error.CAPTURE = processor.Capture.CALL_SITE
+    call_site = function(42)
+    assert ("function", full.line) == (call_site.function, call_site.line)
+    assert {} == call_site.variables
+    assert () == call_site.stack
+
+    Error.CAPTURE = processor.Capture.OFF
+    off = function(42)
+    assert ("", "", 0) == (off.filename, off.function, off.line)
+    assert {} == off.variables
+
+    Error.CAPTURE = 0  # type: ignore
+    assert ("", 0) == (function(42).function, function(42).line)
+    Error.CAPTURE = 2  # type: ignore
+    assert {"value": 42, "Error": processor.MASK} == function(42).variables
+    assert Frame.CAPTURE is processor.Capture.FULL
+
+
+def test_frame_call_site():
+    class Error(Frame):
+        ...
+
+    class Payload:
+        ...
 
+    def function() -> tuple[Error, weakref.ref[Payload]]:
+        payload = Payload()
+        return Error(), weakref.ref(payload)
+
+    error, payload = function()
+    other, _ = function()
+    assert None is payload()
+    assert error.stack[0] is other.stack[0]
+    assert error.stack[2:] == other.stack[2:]
+    assert error.stack[0] == (error.filename, error.line, error.function)
+
+
+def test_frame_interned_bounded(monkeypatch):
+    monkeypatch.setattr(processor, "INTERNED", 8)
+    codes = []
+    for index in range(32):
+        namespace = {"Frame": Frame}
+        source = "def generated():\n    return Frame()"
+        exec(compile(source, f"<generated {index}>", "exec"), namespace)
+        namespace["generated"]()
+        codes.append(weakref.ref(namespace.pop("generated").__code__))
+    gc.collect()
+    assert len(processor._CALL_SITES) <= 8
+    assert len(processor._NAMES) <= 8
+    assert None is codes[0]()
+
+
+def test_sampler_threads(monkeypatch):
+    def switching_random() -> float:
+        sleep(0.001)
+        return 0.0
+
+    monkeypatch.setattr(processor, "random", switching_random)
+    sampler = processor.Sampler(sample=0.5, rate_limit=10)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: sampler.admit(), range(200)))
+    suppressed = [result.suppressed for result in results if result is not None]
+    assert 10 == results.count(None)
+    assert list(range(1, 200 - 10 + 1)) == sorted(suppressed)
+
+
+def test_execute_debugger():
     assert None is processor.execute_debugger(debugger=None, arguments={"value": 42})
     assert None is processor.execute_debugger(debugger=lambda arguments: None, arguments={})
     assert isinstance(
@@ -585,3 +703,24 @@ def test_execute_debugger():
     assert 42 == processor.execute_debugger(
         debugger=lambda arguments: arguments.get("value"), arguments={"value": 42}
     )
+
+
+def test_bind():
+    def variadic(position: int, /, *args: int, keyword: int = 0, **kwargs: int) -> None:
+        ...
+
+    plan = processor.binding(variadic)
+    assert ("position", "args", "keyword", "kwargs") == plan.names
+    assert {
+        "position": 1,
+        "args": (2, 3),
+        "keyword": 0,
+        "kwargs": {"position": 4, "other": 5},
+    } == processor.bind(plan, 1, 2, 3, position=4, other=5)
+
+    payload = {"value": [42]}
+
+    def function(payload: dict[str, list[int]]) -> None:
+        ...
+
+    assert payload is processor.bind(processor.binding(function), payload)["payload"]
@@ -0,0 +1,67 @@
+def test_json_lines_sink(tmp_path):
+    import json
+    from typing import cast
+
+    from pycategory import Failure, Frame, JsonLinesSink, Try, Vector, processor
+
+    @Try.hold(unmask=("value",), debugger=lambda arguments: Vector([arguments["value"]]))
+    def hold_context(value: int, secret: str) -> None:
+        raise ValueError("error")
+
+    class Error(Frame):
+        ...
+
+    def frame_context(value: int) -> Error:
+        return Error(unmask=("value",))
+
+    path = tmp_path / "errors.jsonl"
+    with JsonLinesSink(path, flush_interval=60) as sink:
+        sink.emit(cast(Failure[None], hold_context(42, "secret")).exception)
+        sink.emit(frame_context(42))
+        sink.emit("not a report")
+        assert sink.flush(timeout=10)
+        report, frame = (json.loads(line) for line in path.read_text().splitlines())
+
+    assert "ValueError" == report["exception"]
+    assert "RuntimeErrorReport" == report["type"]
+    assert {"value": 42, "secret": processor.MASK} == report["arguments"]
+    assert [42] == report["debug"]
+    assert "Error" == frame["type"]
+    assert "frame_context" == frame["function"]
+    assert {"value": 42, "Error": processor.MASK} == frame["variables"]
+
+
+def test_json_lines_sink_rotation(tmp_path):
+    from pycategory import Frame, JsonLinesSink
+
+    path = tmp_path / "frames.jsonl"
+    with JsonLinesSink(path, batch_size=1, max_bytes=1, backups=2) as sink:
+        for _ in range(4):
+            sink.emit(Frame())
+    assert ["frames.jsonl", "frames.jsonl.1", "frames.jsonl.2"] == sorted(
+        child.name for child in tmp_path.iterdir()
+    )
+    assert 1 == len(path.read_text().splitlines())
+
+
+def test_json_lines_sink_errors(tmp_path):
+    import json
+
+    from pycategory import Frame, JsonLinesSink, processor
+
+    class Unrepresentable:
+        def __repr__(self) -> str:
+            raise RuntimeError("repr")
+
+    path = tmp_path / "errors.jsonl"
+    (tmp_path / "errors.jsonl.1").mkdir()
+    (tmp_path / "errors.jsonl.1" / "occupied").touch()
+    with JsonLinesSink(path, batch_size=1, max_bytes=1, backups=1) as sink:
+        sink.emit(processor.RuntimeErrorReport(arguments={}, debug=Unrepresentable()))
+        sink.emit(Frame())
+        sink.emit(Frame())
+        assert sink.flush(timeout=10)
+        assert 1 == sink.dropped
+    assert sink._file.closed
+    lines = path.read_text().splitlines()
+    assert ["Frame", "Frame"] == [json.loads(line)["type"] for line in lines]
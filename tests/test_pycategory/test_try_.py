@@ -58,6 +58,133 @@ def test_try_hold():
     } == runtime_error_report.arguments
     assert 0 == runtime_error_report.debug
 
+    payload = {"value": [42]}
+
+    @Try.hold(debugger=lambda arguments: arguments["payload"])
+    def payload_context(payload: dict[str, list[int]]) -> None:
+        raise Exception("error")
+
+    report = cast(Failure[None], payload_context(payload)).exception.args[-1]
+    assert payload is cast(processor.RuntimeErrorReport, report).debug
+
+    values = [42]
+
+    @Try.hold(unmask=("values",))
+    def lazy_context(values: list[int]) -> None:
+        raise Exception("error")
+
+    report = cast(Failure[None], lazy_context(values)).exception.args[-1]
+    values.append(43)
+    assert {"values": [42, 43]} == cast(processor.RuntimeErrorReport, report).arguments
+    values.append(44)
+    assert {"values": [42, 43]} == cast(processor.RuntimeErrorReport, report).arguments
+
+
+def test_try_hold_sampling():
+    from typing import cast
+
+    from pycategory import Failure, Try, processor
+
+    def report(result: Try[None], /) -> object:
+        return cast(Failure[None], result).exception.args[-1]
+
+    @Try.hold(rate_limit=2)
+    def limited(value: int) -> None:
+        raise Exception("error")
+
+    assert processor.RuntimeErrorReport is type(report(limited(0)))
+    assert processor.RuntimeErrorReport is type(report(limited(1)))
+    assert processor.SuppressedErrorReport(suppressed=1) == report(limited(2))
+    assert processor.SuppressedErrorReport(suppressed=2) == report(limited(3))
+
+    @Try.hold(sample=0.0)
+    def unsampled(value: int) -> None:
+        raise Exception("error")
+
+    assert processor.SuppressedErrorReport(suppressed=1) == report(unsampled(0))
+
+    @Try.hold
+    def policy(value: int) -> None:
+        raise Exception("error")
+
+    processor.RuntimeErrorReport.RATE_LIMIT = 1
+    try:
+        assert processor.RuntimeErrorReport is type(report(policy(0)))
+        assert processor.SuppressedErrorReport is type(report(policy(1)))
+    finally:
+        processor.RuntimeErrorReport.RATE_LIMIT = None
+
+
+def test_try_hold_background_debugger():
+    from concurrent.futures import Future
+    from threading import Event
+    from typing import cast
+
+    from pycategory import Failure, Try, processor
+
+    @Try.hold(debugger=lambda arguments: arguments["value"], debugger_mode="background")
+    def background(value: int) -> None:
+        raise Exception("error")
+
+    report = cast(Failure[None], background(42)).exception.args[-1]
+    debug = cast(processor.RuntimeErrorReport, report).debug
+    assert Future is type(debug)
+    assert 42 == cast(Future[int], debug).result(timeout=10)
+
+    @Try.hold(debugger=lambda arguments: arguments, debugger_mode="background")
+    def shared(values: list[int]) -> None:
+        raise Exception("error")
+
+    values = [42]
+    report = cast(Failure[None], shared(values)).exception.args[-1]
+    debugged = cast(processor.RuntimeErrorReport, report).debug.result(timeout=10)
+    assert {"values": [42]} == debugged
+    assert values is debugged["values"]
+
+    class Worker(processor.DebuggerWorker):
+        QUEUE_SIZE = 1
+
+    started, release = Event(), Event()
+    worker = Worker()
+    running = worker.submit(lambda _: started.set() or release.wait(10), {"value": 0})
+    assert started.wait(10)
+    pending = worker.submit(lambda arguments: arguments["value"], {"value": 1})
+    dropped = worker.submit(lambda arguments: arguments["value"], {"value": 2})
+    release.set()
+    assert True is running.result(timeout=10)
+    assert 1 == pending.result(timeout=10)
+    assert dropped.cancelled()
+
+    def exit(_: object) -> None:
+        raise SystemExit(1)
+
+    assert SystemExit is type(worker.submit(exit, {"value": 0}).exception(timeout=10))
+    assert 3 == worker.submit(lambda arguments: arguments["value"], {"value": 3}).result(10)
+
+
+def test_try_hold_background_debugger_fork():
+    import os
+
+    import pytest
+
+    from pycategory import processor
+
+    if not hasattr(os, "fork"):
+        pytest.skip("os.fork is not available")
+    worker = processor.DebuggerWorker()
+    assert 1 == worker.submit(lambda arguments: arguments["value"], {"value": 1}).result(10)
+    read, write = os.pipe()
+    if (pid := os.fork()) == 0:
+        try:
+            value = worker.submit(lambda arguments: arguments["value"], {"value": 7}).result(10)
+            os.write(write, bytes([value]))
+        finally:
+            os._exit(0)
+    os.close(write)
+    os.waitpid(pid, 0)
+    assert b"\x07" == os.read(read, 1)
+    os.close(read)
+
 
 def test_try_do():
     from pycategory import Failure, Right, Success, Try, TryDo
@@ -355,3 +482,43 @@ def test_pattern_match():
             assert True
         case _:
             assert False
+
+
+def test_lazy():
+    from functools import reduce
+
+    from pycategory import Failure, Success, Try
+
+    lazy = reduce(lambda try_, _: try_.map(lambda v: v + 1), range(100_000), Success(0).lazy())
+    assert Success(100_000) == lazy
+    assert True is lazy.is_success()
+
+    def failing(value: int, /) -> Try[int]:
+        return Failure[int](ValueError(value))
+
+    failure = Success(1).lazy().flat_map(failing).map(lambda v: v + 1)
+    assert True is failure.is_failure()
+    assert Success(42) == failure.recover(lambda _: 42)
+    match failure.pattern:
+        case Failure(exception):
+            assert ValueError is type(exception)
+        case _:
+            assert False
+
+
+def test_immutable():
+    import pickle
+
+    from pycategory import Failure, Success
+
+    exception = ValueError(42)
+    assert not hasattr(Failure(exception), "__dict__")
+    assert not hasattr(Success(42), "__dict__")
+    try:
+        Failure(exception).exception = ValueError(0)  # type: ignore
+        assert False
+    except AttributeError:
+        assert exception is Failure(exception).exception
+
+    assert Success(None) is Success(None)
+    assert Success(42) == pickle.loads(pickle.dumps(Success(42)))